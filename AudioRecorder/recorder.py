@@ -4,10 +4,18 @@ Simple Audio Recorder
 Records microphone, desktop audio, or both with a simple UI.
 """
 
+import ctypes
 import json
+import logging
 import os
+import queue
+import re
+import shutil
 import subprocess
+import sys
+import tempfile
 import threading
+import wave
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import time
@@ -31,17 +39,39 @@ try:
 except ImportError:
     keyboard = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 SAMPLE_RATE = 44100
 CHUNK_SIZE = 1024
+# Frames per block when mixing a take (keeps scratch cache-resident)
+MIX_BLOCK = 65536
+# Seconds a device scan stays fresh for the Advanced combos
+DEVICES_TTL = 10.0
 CONFIG_FILE = Path(__file__).parent / "config.json"
 DEFAULT_HOTKEY = "alt+r"
-DEFAULT_SAVE_DIR = str(Path(__file__).parent / "recordings")
+# Timestamp in recording filenames (local time)
+FILENAME_TIME_FORMAT = "%d-%m-%Y_%H-%M-%S"
+RECORDINGS_DIR = Path(__file__).resolve().parent / "recordings"
+APPROVED_DIR = RECORDINGS_DIR / "Approved"
+DEFAULT_SAVE_DIR = str(RECORDINGS_DIR)
+# In-progress recordings are streamed here, next to recordings/ so that
+# saving a single-stream take is a rename rather than a copy
+SPOOL_DIR = RECORDINGS_DIR / ".spool"
+# Deletes every ASCII character that is not allowed in a filename phone suffix
+_PHONE_TRANS = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")
+))
+# Same filter for any string: \w is str.isalnum() plus "_"
+_PHONE_STRIP_RE = re.compile(r"[^\w\-]")
 
 
 def get_resource_path(relative_path: str) -> Path:
     """Get absolute path to resource, works for dev and PyInstaller."""
-    import sys
     if hasattr(sys, '_MEIPASS'):
         # Running as compiled exe
         return Path(sys._MEIPASS) / relative_path
@@ -54,8 +84,8 @@ def load_config() -> dict:
     """Load configuration from file."""
     try:
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            data = CONFIG_FILE.read_bytes()
+            return orjson.loads(data) if orjson else json.loads(data)
     except Exception:
         pass
     return {
@@ -66,13 +96,148 @@ def load_config() -> dict:
     }
 
 
+def _dump_config(config: dict) -> bytes:
+    """Serialize config as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
 def save_config(config: dict):
-    """Save configuration to file."""
+    """Save configuration to file, skipping the write if nothing changed."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = _dump_config(config)
+        if CONFIG_FILE.exists() and CONFIG_FILE.read_bytes() == data:
+            return
+        CONFIG_FILE.write_bytes(data)
     except Exception as e:
-        print(f"Failed to save config: {e}")
+        logger.warning("Failed to save config: %s", e)
+
+
+_STYLES_DONE = False
+
+
+def _init_styles():
+    """Configure the app's ttk styles once per process (styles are global to Tk)."""
+    global _STYLES_DONE
+    if _STYLES_DONE:
+        return
+    style = ttk.Style()
+    # One Tcl call for all styles instead of one configure per style
+    style.theme_settings(style.theme_use(), {
+        "TButton": {"configure": {"font": ("Arial", 10)}},
+        "Small.TButton": {"configure": {"font": ("Arial", 8)}},
+        "Link.TButton": {"configure": {"font": ("Arial", 9, "underline")}},
+        # Accent.TButton for a primary look
+        "Accent.TButton": {"configure": {"font": ("Arial", 10, "bold"), "foreground": "#007acc"}},
+    })
+    _STYLES_DONE = True
+
+
+class Win32Hotkey:
+    """Global hotkey registered with the Win32 RegisterHotKey API.
+
+    Windows only posts WM_HOTKEY for the registered chord, so unlike the
+    keyboard package's low-level hook, other keystrokes never reach Python.
+    """
+
+    HOTKEY_ID = 1
+    WM_HOTKEY = 0x0312
+    WM_QUIT = 0x0012
+    MOD_NOREPEAT = 0x4000
+    MODIFIERS = {
+        'alt': 0x0001, 'ctrl': 0x0002, 'control': 0x0002,
+        'shift': 0x0004, 'win': 0x0008, 'windows': 0x0008,
+    }
+    # Tk keysyms (as captured by HotkeyDialog) and keyboard-style names -> virtual-key codes
+    KEYS = {
+        'backspace': 0x08, 'tab': 0x09, 'return': 0x0D, 'enter': 0x0D,
+        'pause': 0x13, 'caps_lock': 0x14, 'caps lock': 0x14,
+        'escape': 0x1B, 'esc': 0x1B, 'space': 0x20, 'prior': 0x21, 'page up': 0x21,
+        'next': 0x22, 'page down': 0x22, 'end': 0x23, 'home': 0x24,
+        'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+        'print': 0x2C, 'insert': 0x2D, 'delete': 0x2E,
+        'semicolon': 0xBA, 'equal': 0xBB, 'comma': 0xBC, 'minus': 0xBD,
+        'period': 0xBE, 'slash': 0xBF, 'grave': 0xC0, 'bracketleft': 0xDB,
+        'backslash': 0xDC, 'bracketright': 0xDD, 'apostrophe': 0xDE,
+        'num_lock': 0x90, 'num lock': 0x90, 'scroll_lock': 0x91, 'scroll lock': 0x91,
+        'kp_multiply': 0x6A, 'kp_add': 0x6B, 'kp_subtract': 0x6D,
+        'kp_decimal': 0x6E, 'kp_divide': 0x6F, 'kp_enter': 0x0D,
+        **{f'kp_{n}': 0x60 + n for n in range(10)},
+    }
+
+    def __init__(self, hotkey: str, callback):
+        self.hotkey = hotkey
+        self.callback = callback
+        self.registered = False
+        self._thread = None
+        self._thread_id = None
+        self._ready = threading.Event()
+
+    @classmethod
+    def parse(cls, hotkey: str) -> tuple[int, int] | None:
+        """Parse e.g. "ctrl+shift+r" into (modifiers, vk). None if unsupported."""
+        modifiers = 0
+        vk = None
+        for part in hotkey.lower().split('+'):
+            part = part.strip()
+            if part in cls.MODIFIERS:
+                modifiers |= cls.MODIFIERS[part]
+            elif vk is not None:
+                return None  # RegisterHotKey takes a single non-modifier key
+            elif len(part) == 1 and part.isalnum():
+                vk = ord(part.upper())
+            elif part[:1] == 'f' and part[1:].isdigit() and 1 <= int(part[1:]) <= 24:
+                vk = 0x70 + int(part[1:]) - 1
+            elif part in cls.KEYS:
+                vk = cls.KEYS[part]
+            else:
+                return None
+        if vk is None:
+            return None
+        return modifiers, vk
+
+    def start(self) -> bool:
+        """Register the hotkey on its own message-loop thread."""
+        if sys.platform != 'win32' or self.parse(self.hotkey) is None:
+            return False
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=2.0)
+        return self.registered
+
+    def stop(self):
+        """Unregister the hotkey and end the message loop."""
+        if self._thread is None:
+            return
+        if self._thread_id is not None:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        self._thread_id = None
+        self.registered = False
+
+    def _run(self):
+        """Message loop: hwnd=NULL hotkeys post WM_HOTKEY to this thread's queue."""
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        modifiers, vk = self.parse(self.hotkey)
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        # RegisterHotKey is per-thread, so register and unregister here
+        self.registered = bool(user32.RegisterHotKey(
+            None, self.HOTKEY_ID, modifiers | self.MOD_NOREPEAT, vk
+        ))
+        self._ready.set()
+        if not self.registered:
+            return
+        msg = wintypes.MSG()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == self.WM_HOTKEY:
+                    self.callback()
+        finally:
+            user32.UnregisterHotKey(None, self.HOTKEY_ID)
 
 
 class HotkeyDialog(tk.Toplevel):
@@ -521,6 +686,8 @@ class AutoRecordListener:
         self.is_listening = False
         self.cooldown_until = None
         self.reference_audio = None
+        self.reference_norm = None  # Peak-normalized reference, computed once
+        self._norm_scratch = None  # Reused buffer for the normalized window
         self.listener_thread = None
         self.loopback_device = None
         # Track consecutive detections
@@ -542,6 +709,8 @@ class AutoRecordListener:
             if audio.max() > 1:
                 audio = audio / 32768.0
             self.reference_audio = audio
+            ref_max = float(np.abs(audio).max())
+            self.reference_norm = audio / ref_max if ref_max >= 1e-10 else None
             print(f"Loaded reference beep: {len(audio)} samples @ {sample_rate}Hz")
             return True
         except Exception as e:
@@ -561,17 +730,13 @@ class AutoRecordListener:
             print("sounddevice not available")
             return False
 
-        # Find loopback device
+        # Find loopback device (reuses the app's cached device list)
         devices = []
-        try:
-            for i, d in enumerate(sd.query_devices()):
-                if d['max_input_channels'] > 0:
-                    name = d['name'].lower()
-                    if any(kw in name for kw in ['stereo mix', 'loopback', 'what u hear', 'wave out']):
-                        devices.append((i, d['name']))
-        except Exception as e:
-            print(f"Failed to query devices: {e}")
-            return False
+        for i, d in enumerate(self.app.recorder.get_devices()):
+            if d['max_input_channels'] > 0:
+                name = d['name'].lower()
+                if any(kw in name for kw in ['stereo mix', 'loopback', 'what u hear', 'wave out']):
+                    devices.append((i, d['name']))
 
         if not devices:
             print("No loopback device found for auto-record")
@@ -608,6 +773,7 @@ class AutoRecordListener:
                 blocksize=CHUNK_SIZE
             ) as stream:
                 audio_buffer = np.zeros(buffer_size, dtype=np.float32)
+                self._norm_scratch = np.empty(buffer_size, dtype=np.float32)
 
                 while self.is_listening:
                     # Check cooldown
@@ -618,11 +784,12 @@ class AutoRecordListener:
 
                     # Read audio
                     data, _ = stream.read(CHUNK_SIZE)
-                    data = data.flatten()
+                    n = len(data)
 
-                    # Shift buffer and add new data
-                    audio_buffer = np.roll(audio_buffer, -len(data))
-                    audio_buffer[-len(data):] = data
+                    # Shift buffer in place and add new data (np.roll would
+                    # reallocate the whole 2 s window on every read)
+                    audio_buffer[:-n] = audio_buffer[n:]
+                    audio_buffer[-n:] = data[:, 0]
 
                     check_interval += 1
                     # Only check every ~5 reads (~0.1 seconds at 1024 chunk size)
@@ -665,7 +832,7 @@ class AutoRecordListener:
 
         try:
             # Stage 1: Energy check - reject silence
-            rms = np.sqrt(np.mean(audio_buffer ** 2))
+            rms = np.sqrt(np.dot(audio_buffer, audio_buffer) / len(audio_buffer))
             if rms < 0.01:  # Too quiet, likely silence
                 return False
 
@@ -726,15 +893,14 @@ class AutoRecordListener:
         try:
             from scipy import signal
 
-            # Normalize both signals
-            ref_max = np.abs(self.reference_audio).max()
-            buf_max = np.abs(audio_buffer).max()
-            
-            if ref_max < 1e-10 or buf_max < 1e-10:
+            # Normalize both signals (reference is normalized once on load)
+            ref = self.reference_norm
+            buf_max = max(float(audio_buffer.max()), -float(audio_buffer.min()))
+
+            if ref is None or buf_max < 1e-10:
                 return False
-                
-            ref = self.reference_audio / ref_max
-            buf = audio_buffer / buf_max
+
+            buf = np.multiply(audio_buffer, 1.0 / buf_max, out=self._norm_scratch)
 
             # Cross-correlate
             correlation = signal.correlate(buf, ref, mode='valid')
@@ -872,6 +1038,9 @@ class RecordingOverlay(tk.Toplevel):
         self.start_time = None
         self.mic_level = 0
         self.desk_level = 0
+        # Last drawn (width, color) per bar canvas, to skip redundant updates
+        self._bar_state = {}
+        self._levels_after_id = None
 
         self.blink()
         self.update_levels()
@@ -900,14 +1069,14 @@ class RecordingOverlay(tk.Toplevel):
         self.after(500, self.blink)
 
     def start_timer(self):
-        self.start_time = datetime.now()
+        # Monotonic clock: immune to wall-clock jumps (DST, NTP sync)
+        self.start_time = time.monotonic()
         self.update_timer()
 
     def update_timer(self):
         if self.start_time is None:
             return
-        elapsed = datetime.now() - self.start_time
-        mins, secs = divmod(int(elapsed.total_seconds()), 60)
+        mins, secs = divmod(int(time.monotonic() - self.start_time), 60)
         self.time_label.config(text=f"{mins:02d}:{secs:02d}")
         self.after(1000, self.update_timer)
 
@@ -917,33 +1086,34 @@ class RecordingOverlay(tk.Toplevel):
             return
 
         if self.recorder:
-            # Get recent audio levels
-            with self.recorder.lock:
-                if self.recorder.mic_data and len(self.recorder.mic_data) > 0:
-                    recent_mic = self.recorder.mic_data[-1] if self.recorder.mic_data else np.array([0])
-                    self.mic_level = min(1.0, np.abs(recent_mic).max() * 3)
-                else:
-                    self.mic_level *= 0.8  # Decay
-
-                if self.recorder.desktop_data and len(self.recorder.desktop_data) > 0:
-                    recent_desk = self.recorder.desktop_data[-1] if self.recorder.desktop_data else np.array([0])
-                    self.desk_level = min(1.0, np.abs(recent_desk).max() * 3)
-                else:
-                    self.desk_level *= 0.8  # Decay
-
-        # Update mic bar
-        mic_width = int(self.mic_level * 160)
-        color = self._get_level_color(self.mic_level)
-        self.mic_canvas.coords(self.mic_bar, 0, 0, mic_width, 12)
-        self.mic_canvas.itemconfig(self.mic_bar, fill=color)
-
-        # Update desktop bar
-        desk_width = int(self.desk_level * 160)
-        color = self._get_level_color(self.desk_level)
-        self.desk_canvas.coords(self.desk_bar, 0, 0, desk_width, 12)
-        self.desk_canvas.itemconfig(self.desk_bar, fill=color)
-
-        self.after(50, self.update_levels)
+            # Peaks are single floats published by the recording threads,
+            # so reading them never contends with audio capture. Each one is
+            # consumed (reset to 0) so a stalled stream decays instead of
+            # freezing the bar at its last value.
+            recorder = self.recorder
+            mic_peak = min(1.0, recorder.mic_peak * 3)
+            recorder.mic_peak = 0.0
+            desk_peak = min(1.0, recorder.desktop_peak * 3)
+            recorder.desktop_peak = 0.0
+            # Fast attack, exponential decay
+            self.mic_level = max(mic_peak, self.mic_level * 0.8)
+            self.desk_level = max(desk_peak, self.desk_level * 0.8)
+
+        self._draw_bar(self.mic_canvas, self.mic_bar, self.mic_level)
+        self._draw_bar(self.desk_canvas, self.desk_bar, self.desk_level)
+
+        self._levels_after_id = self.after(50, self.update_levels)
+
+    def _draw_bar(self, canvas: tk.Canvas, bar: int, level: float):
+        """Resize/recolor a level bar, touching the canvas only on change."""
+        width = int(level * 160)
+        color = self._get_level_color(level)
+        last_width, last_color = self._bar_state.get(canvas, (None, None))
+        if width != last_width:
+            canvas.coords(bar, 0, 0, width, 12)
+        if color != last_color:
+            canvas.itemconfig(bar, fill=color)
+        self._bar_state[canvas] = (width, color)
 
     def _get_level_color(self, level: float) -> str:
         """Get color based on level (green -> yellow -> red)."""
@@ -958,106 +1128,232 @@ class RecordingOverlay(tk.Toplevel):
         self.is_blinking = False
         self.is_running = False
         self.start_time = None
+        if self._levels_after_id is not None:
+            self.after_cancel(self._levels_after_id)
+            self._levels_after_id = None
         self.destroy()
 
 
+class Take:
+    """A finished recording: one mono int16 WAV spool file per captured stream."""
+
+    def __init__(self, spools: list[Path]):
+        self.spools = []
+        self.frames = []
+        for path in spools:
+            try:
+                with wave.open(str(path), 'rb') as spool:
+                    frames = spool.getnframes()
+            except (wave.Error, EOFError, OSError):
+                frames = 0
+            if frames:
+                self.spools.append(path)
+                self.frames.append(frames)
+            else:
+                # Stream failed or captured nothing - treat it as absent
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Number of frames in the take (shortest stream when mixing)."""
+        return min(self.frames) if self.frames else 0
+
+    def discard(self):
+        """Delete the spool files."""
+        for path in self.spools:
+            path.unlink(missing_ok=True)
+        self.spools = []
+        self.frames = []
+
+
 class AudioRecorder:
     """Handles audio recording from different sources."""
 
+    # Device name keywords (matched against the lowercased name)
+    VIRTUAL_KEYWORDS = ('sound mapper', 'primary')
+    LOOPBACK_KEYWORDS = ('stereo mix', 'what u hear', 'loopback', 'wave out', 'output', 'mixage')
+    MIC_PRIORITY_KEYWORDS = ('microphone', 'mic', 'headset', 'webcam', 'usb', 'realtek', 'input')
+    REAL_MIC_KEYWORDS = ('microphone', 'mic', 'headset')
+
     def __init__(self):
         self.is_recording = False
-        self.mic_data = []
-        self.desktop_data = []
+        self.mic_spool = None
+        self.desktop_spool = None
+        # Peak of the latest block per stream, written by the recording threads
+        self.mic_peak = 0.0
+        self.desktop_peak = 0.0
         self.mic_thread = None
         self.desktop_thread = None
-        self.lock = threading.Lock()
+        # sd.query_devices() snapshot and its classification, filled lazily
+        # and by refresh_devices()
+        self._devices = None
+        self._mics = []
+        self._loopbacks = []
+        self._default_mic = None
+        # Spools whose capture thread has not closed them yet. stop() takes a
+        # spool out to abandon it; the thread then deletes it when it exits.
+        self._live_spools = set()
+        self._spool_lock = threading.Lock()
+        self._sweep_spools()
+        # Finished takes are encoded off the UI thread by a single writer
+        self._save_queue = queue.Queue()
+        # (success, error, on_done) for finished saves, delivered by deliver_saves()
+        self._save_results = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._writer_thread.start()
+
+    def refresh_devices(self):
+        """Re-enumerate audio devices with a single PortAudio query and classify them."""
+        self._devices = []
+        if sd is not None:
+            try:
+                self._devices = list(sd.query_devices())
+            except Exception as e:
+                print(f"Error getting devices: {e}")
+
+        # Single pass: split inputs into microphones and loopbacks
+        mics = []
+        loopbacks = []
+        for i, d in enumerate(self._devices):
+            if d['max_input_channels'] <= 0:
+                continue
+            name = d['name']
+            name_lower = name.lower()
+            # Skip Windows virtual mappers - they route to default device
+            if any(kw in name_lower for kw in self.VIRTUAL_KEYWORDS):
+                continue
+            if any(kw in name_lower for kw in self.LOOPBACK_KEYWORDS):
+                loopbacks.append((i, name))
+            else:
+                # Prioritize actual microphones by keywords
+                priority = 0 if any(kw in name_lower for kw in self.MIC_PRIORITY_KEYWORDS) else 1
+                is_real_mic = any(kw in name_lower for kw in self.REAL_MIC_KEYWORDS)
+                mics.append((priority, i, name, is_real_mic))
+
+        mics.sort(key=lambda m: (m[0], m[1]))
+        self._mics = [(i, name) for _, i, name, _ in mics]
+        self._loopbacks = loopbacks
+        # Prefer a real microphone, else the first non-loopback device
+        real_mics = [i for _, i, _, is_real_mic in mics if is_real_mic]
+        if real_mics:
+            self._default_mic = real_mics[0]
+        else:
+            self._default_mic = self._mics[0][0] if self._mics else None
 
-    def get_input_devices(self) -> list[tuple[int, str, bool]]:
-        """Get all input devices. Returns (index, name, is_loopback)."""
-        if sd is None:
-            return []
-        devices = []
-        try:
-            for i, d in enumerate(sd.query_devices()):
-                if d['max_input_channels'] > 0:
-                    name = d['name']
-                    # Skip Windows virtual mappers - they route to default device
-                    if 'sound mapper' in name.lower() or 'primary' in name.lower():
-                        continue
-                    # Check if it's a loopback device
-                    is_loopback = any(kw in name.lower() for kw in
-                        ['stereo mix', 'what u hear', 'loopback', 'wave out', 'output', 'mixage'])
-                    devices.append((i, name, is_loopback))
-        except Exception as e:
-            print(f"Error getting devices: {e}")
-        return devices
+    def get_devices(self) -> list[dict]:
+        """Get the cached device list (as returned by sd.query_devices())."""
+        if self._devices is None:
+            self.refresh_devices()
+        return self._devices
+
+    def get_device_info(self, device_id: int) -> dict:
+        """Get a device's info from the cache, querying PortAudio if it is unknown."""
+        devices = self.get_devices()
+        if 0 <= device_id < len(devices):
+            return devices[device_id]
+        return sd.query_devices(device_id)
 
     def get_microphones(self) -> list[tuple[int, str]]:
-        """Get microphone devices (non-loopback inputs)."""
-        mics = [(i, name) for i, name, is_loopback in self.get_input_devices() if not is_loopback]
-        # Prioritize actual microphones by keywords
-        priority_keywords = ['microphone', 'mic', 'headset', 'webcam', 'usb', 'realtek', 'input']
-        mics.sort(key=lambda x: (
-            0 if any(kw in x[1].lower() for kw in priority_keywords) else 1,
-            x[0]
-        ))
-        return mics
+        """Get microphone devices (non-loopback inputs), best candidates first."""
+        self.get_devices()
+        return self._mics
 
     def get_loopback_devices(self) -> list[tuple[int, str]]:
         """Get loopback devices (Stereo Mix, etc.)."""
-        return [(i, name) for i, name, is_loopback in self.get_input_devices() if is_loopback]
+        self.get_devices()
+        return self._loopbacks
 
     def get_default_mic(self) -> int | None:
         """Get the best microphone (not loopback)."""
-        mics = self.get_microphones()
-        if not mics:
-            return None
-
-        # Try to find a real microphone first
-        for i, name in mics:
-            name_lower = name.lower()
-            if any(kw in name_lower for kw in ['microphone', 'mic', 'headset']):
-                return i
-
-        # Fall back to first non-loopback device
-        return mics[0][0]
+        self.get_devices()
+        return self._default_mic
 
     def get_default_loopback(self) -> int | None:
         """Get the first available loopback device."""
         loopbacks = self.get_loopback_devices()
         return loopbacks[0][0] if loopbacks else None
 
-    def _record_device(self, device_id: int, data_list: list, name: str):
-        """Record from a device."""
+    def _record_device(self, device_id: int, spool_path: Path, name: str, peak_attr: str):
+        """Record from a device as int16, streaming blocks to ``spool_path``.
+
+        Each block's peak is published to ``peak_attr`` for the level meter.
+        Memory use is one block regardless of how long the recording runs.
+        """
         try:
-            device_info = sd.query_devices(device_id)
+            device_info = self.get_device_info(device_id)
             channels = min(device_info['max_input_channels'], 2)
 
             with sd.InputStream(
                 device=device_id,
                 samplerate=SAMPLE_RATE,
                 channels=channels,
-                dtype='float32',
+                dtype='int16',
                 blocksize=CHUNK_SIZE
-            ) as stream:
+            ) as stream, wave.open(str(spool_path), 'wb') as spool:
+                spool.setnchannels(1)
+                spool.setsampwidth(2)
+                spool.setframerate(SAMPLE_RATE)
                 print(f"Recording from: {name} (channels: {channels})")
+                # Reused per-block buffers - nothing is allocated on our side per read
+                mix_buf = np.empty(CHUNK_SIZE, dtype=np.int32)
+                mono_buf = np.empty(CHUNK_SIZE, dtype=np.int16)
+
+                # Pick the mono conversion once, instead of branching per block
+                if channels == 2:
+                    def to_mono(data: np.ndarray) -> np.ndarray:
+                        # (L + R) >> 1, summed in int32 so it cannot overflow
+                        np.add(data[:, 0], data[:, 1], out=mix_buf, dtype=np.int32)
+                        np.right_shift(mix_buf, 1, out=mix_buf)
+                        np.copyto(mono_buf, mix_buf, casting='unsafe')
+                        return mono_buf
+                else:
+                    def to_mono(data: np.ndarray) -> np.ndarray:
+                        return data.reshape(-1)
+
+                read = stream.read
+                write = spool.writeframesraw
                 while self.is_recording:
-                    data, _ = stream.read(CHUNK_SIZE)
-                    # Convert to mono if stereo
-                    if channels == 2:
-                        mono = data.mean(axis=1)
-                    else:
-                        mono = data.flatten()
-                    with self.lock:
-                        data_list.append(mono.copy())
+                    data, _ = read(CHUNK_SIZE)
+                    mono = to_mono(data)
+                    # max/min instead of abs() - abs(-32768) overflows int16
+                    peak = max(int(mono.max()), -int(mono.min()))
+                    setattr(self, peak_attr, peak / 32768.0)
+                    # Device samples are already int16 PCM; the header is patched on close
+                    write(mono)
         except Exception as e:
             print(f"Recording error ({name}): {e}")
+        finally:
+            with self._spool_lock:
+                abandoned = spool_path not in self._live_spools
+                self._live_spools.discard(spool_path)
+            if abandoned:
+                spool_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _sweep_spools():
+        """Delete spools left behind by a previous run that crashed mid-take."""
+        if not SPOOL_DIR.is_dir():
+            return
+        for path in SPOOL_DIR.glob("*.wav"):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning("Could not remove stale spool %s: %s", path, e)
+
+    @staticmethod
+    def _new_spool(stream: str) -> Path:
+        """Create an empty spool file for one stream of a take."""
+        SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix=f"{stream}_", suffix=".wav", dir=SPOOL_DIR)
+        os.close(fd)
+        return Path(path)
 
     def start(self, mode: str, mic_device: int = None, desktop_device: int = None):
         """Start recording."""
         self.is_recording = True
-        self.mic_data = []
-        self.desktop_data = []
+        self.mic_spool = None
+        self.desktop_spool = None
+        self.mic_peak = 0.0
+        self.desktop_peak = 0.0
 
         # Get defaults if not specified
         if mic_device is None:
@@ -1070,13 +1366,13 @@ class AudioRecorder:
         print(f"Mode: {mode}")
         if mic_device is not None:
             try:
-                mic_info = sd.query_devices(mic_device)
+                mic_info = self.get_device_info(mic_device)
                 print(f"Mic device: [{mic_device}] {mic_info['name']}")
             except:
                 print(f"Mic device: [{mic_device}] (unknown)")
         if desktop_device is not None:
             try:
-                desk_info = sd.query_devices(desktop_device)
+                desk_info = self.get_device_info(desktop_device)
                 print(f"Desktop device: [{desktop_device}] {desk_info['name']}")
             except:
                 print(f"Desktop device: [{desktop_device}] (unknown)")
@@ -1084,9 +1380,11 @@ class AudioRecorder:
 
         # Start mic recording
         if mode in ("mic", "both") and mic_device is not None:
+            self.mic_spool = self._new_spool("mic")
+            self._live_spools.add(self.mic_spool)
             self.mic_thread = threading.Thread(
                 target=self._record_device,
-                args=(mic_device, self.mic_data, "Microphone"),
+                args=(mic_device, self.mic_spool, "Microphone", "mic_peak"),
                 daemon=True
             )
             self.mic_thread.start()
@@ -1096,17 +1394,19 @@ class AudioRecorder:
         # Start desktop recording
         if mode in ("desktop", "both"):
             if desktop_device is not None:
+                self.desktop_spool = self._new_spool("desktop")
+                self._live_spools.add(self.desktop_spool)
                 self.desktop_thread = threading.Thread(
                     target=self._record_device,
-                    args=(desktop_device, self.desktop_data, "Desktop Audio"),
+                    args=(desktop_device, self.desktop_spool, "Desktop Audio", "desktop_peak"),
                     daemon=True
                 )
                 self.desktop_thread.start()
             else:
                 print("WARNING: No loopback device found! Enable Stereo Mix in Sound settings.")
 
-    def stop(self) -> np.ndarray:
-        """Stop recording and return audio data."""
+    def stop(self) -> Take:
+        """Stop recording and return the spooled take."""
         self.is_recording = False
 
         if self.mic_thread:
@@ -1114,49 +1414,135 @@ class AudioRecorder:
         if self.desktop_thread:
             self.desktop_thread.join(timeout=2)
 
-        mic_audio = None
-        desktop_audio = None
-
-        with self.lock:
-            if self.mic_data:
-                mic_audio = np.concatenate(self.mic_data)
-            if self.desktop_data:
-                desktop_audio = np.concatenate(self.desktop_data)
+        spools = []
+        with self._spool_lock:
+            for path in (self.mic_spool, self.desktop_spool):
+                if path is None:
+                    continue
+                if path in self._live_spools:
+                    # Still being written - leave it to its thread to delete
+                    logger.warning("Capture thread did not stop; dropping %s", path.name)
+                    self._live_spools.discard(path)
+                else:
+                    spools.append(path)
+        take = Take(spools)
+        self.mic_spool = None
+        self.desktop_spool = None
 
         # Debug: show what we captured
         print(f"\n=== Recording Stopped ===")
-        print(f"Mic chunks: {len(self.mic_data)}, samples: {len(mic_audio) if mic_audio is not None else 0}")
-        print(f"Desktop chunks: {len(self.desktop_data)}, samples: {len(desktop_audio) if desktop_audio is not None else 0}")
-        if mic_audio is not None:
-            print(f"Mic audio level: min={mic_audio.min():.4f}, max={mic_audio.max():.4f}")
-        if desktop_audio is not None:
-            print(f"Desktop audio level: min={desktop_audio.min():.4f}, max={desktop_audio.max():.4f}")
+        print(f"Streams: {len(take.spools)}, frames per stream: {take.frames}")
         print("=========================\n")
 
-        # Combine audio
-        if mic_audio is not None and desktop_audio is not None:
-            min_len = min(len(mic_audio), len(desktop_audio))
-            if min_len > 0:
-                combined = (mic_audio[:min_len] * 0.5) + (desktop_audio[:min_len] * 0.5)
-                max_val = np.abs(combined).max()
-                if max_val > 0:
-                    combined = combined / max_val * 0.95
-                return combined
-        elif mic_audio is not None:
-            return mic_audio
-        elif desktop_audio is not None:
-            return desktop_audio
-
-        return np.array([])
-
-    def save(self, filepath: str, audio: np.ndarray) -> bool:
-        """Save audio to WAV file."""
-        if len(audio) == 0:
-            return False
-        audio = np.clip(audio, -1, 1)
-        audio_int16 = (audio * 32767).astype(np.int16)
-        wav.write(filepath, SAMPLE_RATE, audio_int16)
-        return True
+        return take
+
+    def save(self, filepath: str, take: Take) -> bool:
+        """Save a take to a WAV file, consuming its spool files (even on failure)."""
+        try:
+            if len(take) == 0:
+                return False
+            if len(take.spools) == 1:
+                # Already final int16 PCM - just move it into place
+                shutil.move(str(take.spools[0]), filepath)
+            else:
+                self._mix_spools(take, filepath)
+            return True
+        finally:
+            # Spools already moved into place are skipped
+            take.discard()
+
+    def save_async(self, filepath: str, take: Take, on_done=None):
+        """Queue a take for saving on the writer thread.
+
+        on_done(success, error) is called by deliver_saves() once the file is
+        written, so it runs on whichever thread polls - never the writer thread.
+        """
+        self._save_queue.put((filepath, take, on_done))
+
+    def saves_pending(self) -> bool:
+        """Whether any take is still being written or awaits deliver_saves()."""
+        return bool(self._save_queue.unfinished_tasks) or not self._save_results.empty()
+
+    def deliver_saves(self):
+        """Run the on_done callbacks of finished saves on the calling thread."""
+        while True:
+            try:
+                ok, error, on_done = self._save_results.get_nowait()
+            except queue.Empty:
+                return
+            on_done(ok, error)
+
+    def wait_for_saves(self):
+        """Block until every queued take has been written.
+
+        Safe on the UI thread: the writer never waits on its callbacks.
+        """
+        self._save_queue.join()
+
+    def _save_worker(self):
+        """Writer thread: save queued takes one at a time."""
+        while True:
+            filepath, take, on_done = self._save_queue.get()
+            try:
+                try:
+                    ok = self.save(filepath, take)
+                    error = None
+                except Exception as e:
+                    logger.exception("Save error (%s)", filepath)
+                    ok = False
+                    error = e
+                if on_done:
+                    self._save_results.put((ok, error, on_done))
+            finally:
+                self._save_queue.task_done()
+
+    @staticmethod
+    def _mix_spools(take: Take, filepath: str):
+        """Mix a multi-stream take into one WAV normalized to 95% of full scale.
+
+        Streams are read MIX_BLOCK frames at a time: a first pass finds the
+        peak of the sum and a second writes the scaled mix, so memory use does
+        not depend on the length of the take.
+        """
+        n = len(take)
+        readers = [wave.open(str(p), 'rb') for p in take.spools]
+        try:
+            mix = np.empty(MIX_BLOCK, dtype=np.int32)
+
+            def mixed_blocks():
+                for reader in readers:
+                    reader.rewind()
+                for start in range(0, n, MIX_BLOCK):
+                    count = min(MIX_BLOCK, n - start)
+                    block = mix[:count]
+                    block.fill(0)
+                    for reader in readers:
+                        np.add(block, np.frombuffer(reader.readframes(count), dtype=np.int16), out=block)
+                    yield block
+
+            # Equal-weight mix; the weights cancel out in normalization
+            peak = 0
+            for block in mixed_blocks():
+                peak = max(peak, int(block.max()), -int(block.min()))
+            scale = 0.95 * 32767 / peak if peak > 0 else 0.0
+
+            scaled = np.empty(MIX_BLOCK, dtype=np.float32)
+            pcm = np.empty(MIX_BLOCK, dtype=np.int16)
+            with wave.open(filepath, 'wb') as out:
+                out.setnchannels(1)
+                out.setsampwidth(2)
+                out.setframerate(SAMPLE_RATE)
+                for block in mixed_blocks():
+                    count = len(block)
+                    # Scale, round to nearest and cast without temporaries;
+                    # the 0.95 headroom keeps every sample inside int16
+                    np.multiply(block, scale, out=scaled[:count])
+                    np.rint(scaled[:count], out=scaled[:count])
+                    np.copyto(pcm[:count], scaled[:count], casting='unsafe')
+                    out.writeframesraw(pcm[:count])
+        finally:
+            for reader in readers:
+                reader.close()
 
 
 class RecorderApp:
@@ -1168,6 +1554,7 @@ class RecorderApp:
         self.root.geometry("450x520")
         self.root.resizable(False, True)
         self.root.minsize(450, 400)
+        _init_styles()
 
         self.recorder = AudioRecorder()
         self.overlay = None
@@ -1180,12 +1567,28 @@ class RecorderApp:
 
         # Load config
         self.config = load_config()
+        # Config changes are written behind, in one debounced write
+        self._config_dirty = False
+        self._config_write_job = None
+        # root.after id of the pending _poll_saves, if any
+        self._save_poll_job = None
+        # Config snapshots are written in order by a single writer thread
+        self._config_queue = queue.Queue()
+        threading.Thread(target=self._config_worker, daemon=True).start()
         self.hotkey = self.config.get("hotkey", DEFAULT_HOTKEY)
         self.hotkey_registered = False
+        self._registered_key = None
+        # Handles for whichever backend registered the hotkey
+        self._win_hotkey = None
+        self._hotkey_hook = None
+
+        self._devices_loaded = False
+        self._devices_cache_ts = 0.0
+        self._advanced_built = False
 
         self.setup_ui()
-        self._load_devices()
-        self._check_loopback()
+        # Enumerating devices is slow - let the window appear first
+        self.root.after_idle(self._startup_device_check)
         self._register_hotkey()
 
         # Initialize auto-record listener
@@ -1197,8 +1600,26 @@ class RecorderApp:
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _load_devices(self):
+        self.recorder.refresh_devices()
         self._mics = self.recorder.get_microphones()
         self._loopbacks = self.recorder.get_loopback_devices()
+        self._devices_loaded = True
+        self._devices_cache_ts = time.monotonic()
+
+    def _load_devices_cached(self, force: bool = False):
+        """Re-scan devices unless the last scan is younger than DEVICES_TTL."""
+        if not force and time.monotonic() - self._devices_cache_ts < DEVICES_TTL:
+            return
+        self._load_devices()
+
+    def _ensure_devices(self):
+        """Load the device lists if nothing has needed them yet."""
+        if not self._devices_loaded:
+            self._load_devices()
+
+    def _startup_device_check(self):
+        self._ensure_devices()
+        self._check_loopback()
 
     def _check_loopback(self):
         """Check if loopback device is available and warn if not."""
@@ -1231,11 +1652,13 @@ class RecorderApp:
 
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Enable mousewheel scrolling
+        # Enable mousewheel scrolling only while the pointer is over the canvas,
+        # so the handler is not left bound app-wide (or stacked on re-layout)
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
 
         # Pack scrollbar and canvas
         scrollbar.pack(side="right", fill="y")
@@ -1244,6 +1667,10 @@ class RecorderApp:
         return scrollable_frame
 
     def setup_ui(self):
+        # (widget, enabled state) for the controls disabled while recording,
+        # which is everything but the record button
+        self._stateful_widgets = []
+
         # Create scrollable main frame
         main_frame = self._create_scrollable_frame(self.root)
 
@@ -1263,10 +1690,12 @@ class RecorderApp:
             ("Desktop Audio Only", "desktop"),
             ("Both (Mic + Desktop)", "both")
         ]:
-            ttk.Radiobutton(
+            mode_radio = ttk.Radiobutton(
                 mode_frame, text=text,
                 variable=self.mode_var, value=value
-            ).pack(anchor=tk.W, pady=2)
+            )
+            mode_radio.pack(anchor=tk.W, pady=2)
+            self._stateful_widgets.append((mode_radio, "normal"))
 
         # Save Location Settings (moved from Advanced)
         save_frame = ttk.LabelFrame(main_frame, text="Save Location", padding=10)
@@ -1283,8 +1712,8 @@ class RecorderApp:
             command=self.toggle_advanced
         )
         self.toggle_btn.pack(anchor=tk.W, pady=(0, 10))
-
-        self._setup_advanced()
+        self._stateful_widgets.append((self.toggle_btn, "normal"))
+        # Advanced widgets are built on first toggle_advanced()
 
         # Record button
         self.record_btn = ttk.Button(
@@ -1316,11 +1745,13 @@ class RecorderApp:
         )
         self.hotkey_label.pack(side=tk.LEFT, padx=(5, 0))
 
-        ttk.Button(
+        hotkey_btn = ttk.Button(
             hotkey_frame, text="Change",
             command=self.configure_hotkey,
             style="Small.TButton"
-        ).pack(side=tk.RIGHT)
+        )
+        hotkey_btn.pack(side=tk.RIGHT)
+        self._stateful_widgets.append((hotkey_btn, "normal"))
 
         # Troubleshoot link
         troubleshoot_btn = ttk.Button(
@@ -1329,6 +1760,7 @@ class RecorderApp:
             style="Link.TButton"
         )
         troubleshoot_btn.pack(pady=(8, 0))
+        self._stateful_widgets.append((troubleshoot_btn, "normal"))
 
         # Auto Record checkbox
         auto_record_frame = ttk.Frame(main_frame)
@@ -1342,36 +1774,35 @@ class RecorderApp:
         )
         auto_record_cb.pack(anchor=tk.W)
 
-        style = ttk.Style()
-        style.configure("TButton", font=("Arial", 10))
-        style.configure("Small.TButton", font=("Arial", 8))
-        style.configure("Link.TButton", font=("Arial", 9, "underline"))
-        # Define Accent.TButton for a primary look
-        style.configure("Accent.TButton", font=("Arial", 10, "bold"), foreground="#007acc")
-
     def _setup_save_location(self, parent_frame):
         """Setup save location settings in the given frame."""
         # Save mode radio buttons - default to 'default' (Recordings folder)
         current_mode = self.config.get("save_mode", "default")
         self.save_mode_var = tk.StringVar(value=current_mode)
 
-        ttk.Radiobutton(
+        save_radio = ttk.Radiobutton(
             parent_frame, text="Ask where to save every time",
             variable=self.save_mode_var, value="ask",
             command=self._on_save_mode_change
-        ).pack(anchor=tk.W, pady=2)
+        )
+        save_radio.pack(anchor=tk.W, pady=2)
+        self._stateful_widgets.append((save_radio, "normal"))
 
-        ttk.Radiobutton(
+        save_radio = ttk.Radiobutton(
             parent_frame, text="Save in Recordings folder (default)",
             variable=self.save_mode_var, value="default",
             command=self._on_save_mode_change
-        ).pack(anchor=tk.W, pady=2)
+        )
+        save_radio.pack(anchor=tk.W, pady=2)
+        self._stateful_widgets.append((save_radio, "normal"))
 
-        ttk.Radiobutton(
+        save_radio = ttk.Radiobutton(
             parent_frame, text="Auto-save to custom folder:",
             variable=self.save_mode_var, value="auto",
             command=self._on_save_mode_change
-        ).pack(anchor=tk.W, pady=2)
+        )
+        save_radio.pack(anchor=tk.W, pady=2)
+        self._stateful_widgets.append((save_radio, "normal"))
 
         # Save directory selection (only for custom folder)
         save_dir_frame = ttk.Frame(parent_frame)
@@ -1389,6 +1820,7 @@ class RecorderApp:
             command=self._browse_save_dir
         )
         self.browse_btn.pack(side=tk.RIGHT, padx=(5, 0))
+        self._stateful_widgets.append((self.browse_btn, "normal"))
 
         # Update browse button state
         self._update_save_dir_state()
@@ -1403,6 +1835,7 @@ class RecorderApp:
         )
         self.mic_combo.pack(fill=tk.X, pady=(2, 10))
         self.mic_combo.bind("<<ComboboxSelected>>", self._on_mic_change)
+        self._stateful_widgets.append((self.mic_combo, "readonly"))
 
         ttk.Label(self.advanced_frame, text="Desktop Audio (Stereo Mix):").pack(anchor=tk.W)
         self.desktop_var = tk.StringVar()
@@ -1412,31 +1845,30 @@ class RecorderApp:
         )
         self.desktop_combo.pack(fill=tk.X, pady=(2, 10))
         self.desktop_combo.bind("<<ComboboxSelected>>", self._on_desktop_change)
+        self._stateful_widgets.append((self.desktop_combo, "readonly"))
 
-        ttk.Button(
+        refresh_btn = ttk.Button(
             self.advanced_frame, text="Refresh Devices",
-            command=self._refresh_combos
-        ).pack(anchor=tk.E, pady=(5, 0))
+            command=lambda: self._refresh_combos(force=True)
+        )
+        refresh_btn.pack(anchor=tk.E, pady=(5, 0))
+        self._stateful_widgets.append((refresh_btn, "normal"))
 
-    def _refresh_combos(self):
-        self._load_devices()
+    def _refresh_combos(self, force: bool = False):
+        self._load_devices_cached(force)
 
         # Mics
-        mic_opts = ["Default Microphone"]
-        mic_opts.extend([name for _, name in self._mics])
-        self.mic_combo["values"] = mic_opts
+        self.mic_combo["values"] = ["Default Microphone"] + [name for _, name in self._mics]
         self.mic_combo.current(0)
 
         # Desktop/Loopback
         if self._loopbacks:
             desktop_opts = [name for _, name in self._loopbacks]
-            self.desktop_combo["values"] = desktop_opts
-            self.desktop_combo.current(0)
-            self._selected_desktop = self._loopbacks[0][0]
         else:
-            self.desktop_combo["values"] = ["No loopback device found - Enable Stereo Mix"]
-            self.desktop_combo.current(0)
-            self._selected_desktop = None
+            desktop_opts = ["No loopback device found - Enable Stereo Mix"]
+        self.desktop_combo["values"] = desktop_opts
+        self.desktop_combo.current(0)
+        self._selected_desktop = self._loopbacks[0][0] if self._loopbacks else None
 
         self._check_loopback()
 
@@ -1457,7 +1889,7 @@ class RecorderApp:
     def _on_save_mode_change(self):
         """Handle save mode radio button change."""
         self.config["save_mode"] = self.save_mode_var.get()
-        save_config(self.config)
+        self._schedule_config_save()
         self._update_save_dir_state()
 
     def _update_save_dir_state(self):
@@ -1481,17 +1913,17 @@ class RecorderApp:
         if folder:
             self.save_dir_var.set(folder)
             self.config["save_dir"] = folder
-            save_config(self.config)
+            self._schedule_config_save()
 
     def _on_auto_record_change(self):
         """Handle auto-record checkbox change."""
         enabled = self.auto_record_var.get()
         self.config["auto_record_enabled"] = enabled
-        save_config(self.config)
+        self._schedule_config_save()
 
         if enabled:
             if self.auto_record_listener.start_listening():
-                print("Auto-record listening enabled")
+                logger.info("Auto-record listening enabled")
             else:
                 messagebox.showwarning(
                     "Auto-Record",
@@ -1500,42 +1932,83 @@ class RecorderApp:
                 )
                 self.auto_record_var.set(False)
                 self.config["auto_record_enabled"] = False
-                save_config(self.config)
+                self._schedule_config_save()
         else:
             self.auto_record_listener.stop_listening()
-            print("Auto-record listening disabled")
+            logger.info("Auto-record listening disabled")
+
+    def _schedule_config_save(self):
+        """Mark the config dirty and write it once, 500 ms after the last burst of changes."""
+        self._config_dirty = True
+        if self._config_write_job is None:
+            self._config_write_job = self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        """Queue a snapshot of the config for the writer thread."""
+        self._config_write_job = None
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        self._config_queue.put(dict(self.config))
+
+    def _config_worker(self):
+        """Writer thread: save config snapshots one at a time, oldest first."""
+        while True:
+            config = self._config_queue.get()
+            try:
+                save_config(config)
+            finally:
+                self._config_queue.task_done()
 
     def show_troubleshoot(self):
         TroubleshootDialog(self.root)
 
     def _register_hotkey(self):
         """Register the global hotkey."""
+        if self.hotkey_registered and self._registered_key == self.hotkey:
+            return
+
+        # Always unregister first before re-registering
+        self._unregister_hotkey()
+
+        # Native RegisterHotKey on Windows; keyboard's global hook elsewhere
+        # and for chords RegisterHotKey can't express or register
+        self._win_hotkey = Win32Hotkey(self.hotkey, self._on_hotkey)
+        if self._win_hotkey.start():
+            self.hotkey_registered = True
+            self._registered_key = self.hotkey
+            logger.debug("Hotkey registered: %s", self.hotkey)
+            return
+        self._win_hotkey = None
+
         if keyboard is None:
-            print("Keyboard library not available - hotkeys disabled")
+            logger.warning("Keyboard library not available - hotkeys disabled")
             return
 
         try:
-            # Always unregister first before re-registering
-            self._unregister_hotkey()
-
             # Store the hotkey hook so we can remove it later
             self._hotkey_hook = keyboard.add_hotkey(self.hotkey, self._on_hotkey, suppress=False)
             self.hotkey_registered = True
-            print(f"Hotkey registered: {self.hotkey}")
+            self._registered_key = self.hotkey
+            logger.debug("Hotkey registered: %s", self.hotkey)
         except Exception as e:
-            print(f"Failed to register hotkey: {e}")
+            logger.warning("Failed to register hotkey: %s", e)
             self.hotkey_registered = False
 
     def _unregister_hotkey(self):
         """Unregister the global hotkey."""
+        if self._win_hotkey is not None:
+            self._win_hotkey.stop()
+            self._win_hotkey = None
+        self.hotkey_registered = False
+        self._registered_key = None
         if keyboard is None:
             return
         try:
             # Remove specific hotkey instead of unhook_all_hotkeys which is buggy
-            if hasattr(self, '_hotkey_hook') and self._hotkey_hook is not None:
+            if self._hotkey_hook is not None:
                 keyboard.remove_hotkey(self._hotkey_hook)
                 self._hotkey_hook = None
-            self.hotkey_registered = False
         except Exception:
             pass
 
@@ -1548,7 +2021,7 @@ class RecorderApp:
             # Force the event loop to process by updating
             self.root.update_idletasks()
         except Exception as e:
-            print(f"Hotkey callback error: {e}")
+            logger.error("Hotkey callback error: %s", e)
 
     def configure_hotkey(self):
         """Open hotkey configuration dialog."""
@@ -1556,20 +2029,34 @@ class RecorderApp:
         self.root.wait_window(dialog)
 
         if dialog.result:
+            if dialog.result == self.hotkey:
+                return  # Unchanged - keep the existing registration
             self._unregister_hotkey()
             self.hotkey = dialog.result
             self.hotkey_label.config(text=self.hotkey.upper())
             self.config["hotkey"] = self.hotkey
-            save_config(self.config)
+            self._schedule_config_save()
             self._register_hotkey()
 
     def _on_close(self):
         """Handle window close."""
+        # Write the final config before exiting (a no-op if unchanged on disk)
+        if self._config_write_job is not None:
+            self.root.after_cancel(self._config_write_job)
+            self._config_write_job = None
+        # Queued behind any earlier snapshot, so it is the last one written
+        self._config_queue.put(dict(self.config))
+        self._config_queue.join()
         self._unregister_hotkey()
         if hasattr(self, 'auto_record_listener'):
             self.auto_record_listener.stop_listening()
         if self.is_recording:
-            self.recorder.stop()
+            self.recorder.stop().discard()
+        # Don't lose a take that is still being written; its result is dropped
+        if self._save_poll_job is not None:
+            self.root.after_cancel(self._save_poll_job)
+            self._save_poll_job = None
+        self.recorder.wait_for_saves()
         self.root.destroy()
 
     def toggle_advanced(self):
@@ -1579,6 +2066,10 @@ class RecorderApp:
             self.root.geometry("450x520")
             self.advanced_visible = False
         else:
+            if not self._advanced_built:
+                self._setup_advanced()
+                self._advanced_built = True
+                self._refresh_combos()
             self.toggle_btn.pack_forget()
             self.advanced_frame.pack(fill=tk.X, pady=(0, 10))
             self.toggle_btn.pack(anchor=tk.W, pady=(0, 10))
@@ -1586,7 +2077,6 @@ class RecorderApp:
             self.toggle_btn.config(text="Hide Advanced Settings")
             self.root.geometry("450x650")
             self.advanced_visible = True
-            self._refresh_combos()
 
     def toggle_recording(self):
         if not self.is_recording:
@@ -1596,6 +2086,8 @@ class RecorderApp:
 
     def start_recording(self):
         mode = self.mode_var.get()
+        if mode in ("desktop", "both"):
+            self._ensure_devices()
 
         # Warn if no loopback for desktop modes
         if mode in ("desktop", "both") and not self._loopbacks and self._selected_desktop is None:
@@ -1629,21 +2121,8 @@ class RecorderApp:
         self.overlay.start_timer()
 
     def _set_controls_enabled(self, enabled: bool):
-        state = "normal" if enabled else "disabled"
-        for child in self.root.winfo_children():
-            self._set_state_recursive(child, state)
-
-    def _set_state_recursive(self, widget, state):
-        if widget == self.record_btn:
-            return
-        try:
-            wtype = widget.winfo_class()
-            if wtype in ("TRadiobutton", "TCombobox", "TButton"):
-                widget.config(state=state)
-        except Exception:
-            pass
-        for child in widget.winfo_children():
-            self._set_state_recursive(child, state)
+        for widget, enabled_state in self._stateful_widgets:
+            widget.config(state=enabled_state if enabled else "disabled")
 
     def stop_recording(self):
         # Get phone number from overlay before stopping
@@ -1653,15 +2132,13 @@ class RecorderApp:
             self.overlay.stop()
             self.overlay = None
 
-        audio = self.recorder.stop()
+        take = self.recorder.stop()
         self.is_recording = False
 
         self.record_btn.config(text="Start Recording")
         self._set_controls_enabled(True)
-        self.mic_combo.config(state="readonly")
-        self.desktop_combo.config(state="readonly")
 
-        if len(audio) == 0:
+        if len(take) == 0:
             messagebox.showwarning("Warning", "No audio recorded.")
             self.status_label.config(text="Ready", foreground="gray")
             return
@@ -1676,6 +2153,7 @@ class RecorderApp:
 
         if dialog.result is None:
             # User cancelled
+            take.discard()
             self.status_label.config(text="Recording discarded", foreground="gray")
             return
 
@@ -1683,53 +2161,69 @@ class RecorderApp:
         phone_number = dialog.phone_number
 
         # Build filename with phone number if provided
-        timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+        timestamp = time.strftime(FILENAME_TIME_FORMAT)
         if phone_number:
             # Sanitize phone number for filename (remove invalid chars)
-            safe_phone = "".join(c for c in phone_number if c.isalnum() or c in "-_")
+            if phone_number.isascii():
+                safe_phone = phone_number.translate(_PHONE_TRANS)
+            else:
+                safe_phone = _PHONE_STRIP_RE.sub("", phone_number)
             filename = f"recording_{timestamp}_{safe_phone}.wav"
         else:
             filename = f"recording_{timestamp}.wav"
 
         # Determine save directory based on approve/save choice
-        base_dir = Path(__file__).parent / "recordings"
-        if dialog.result == "approve":
-            save_dir = base_dir / "Approved"
-        else:
-            save_dir = base_dir
+        save_dir = APPROVED_DIR if dialog.result == "approve" else RECORDINGS_DIR
 
         # Create directory if it doesn't exist
         try:
             save_dir.mkdir(parents=True, exist_ok=True)
         except Exception as e:
+            take.discard()
             messagebox.showerror("Error", f"Could not create folder:\n{save_dir}\n\n{e}")
             self.status_label.config(text="Save failed", foreground="red")
             return
 
         filepath = save_dir / filename
 
-        try:
-            self.recorder.save(str(filepath), audio)
-            status_text = f"{'Approved' if dialog.result == 'approve' else 'Saved'}: {filepath.name}"
-            self.status_label.config(text=status_text, foreground="green")
-            print(f"Recording saved: {filepath}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Save failed: {e}")
-            self.status_label.config(text="Save failed", foreground="red")
+        # Mixing and writing a long take can take seconds - do it off the UI thread
+        self.status_label.config(text=f"Saving: {filepath.name}...", foreground="gray")
+        status_text = f"{'Approved' if dialog.result == 'approve' else 'Saved'}: {filepath.name}"
+
+        def on_saved(ok, error):
+            if ok:
+                self.status_label.config(text=status_text, foreground="green")
+                logger.info("Recording saved: %s", filepath)
+            else:
+                messagebox.showerror("Error", f"Save failed: {error}")
+                self.status_label.config(text="Save failed", foreground="red")
+
+        self.recorder.save_async(str(filepath), take, on_saved)
+        if self._save_poll_job is None:
+            self._poll_saves()
+
+    def _poll_saves(self):
+        """Deliver finished saves on the Tk thread, polling while any are pending."""
+        self._save_poll_job = None
+        self.recorder.deliver_saves()
+        if self.recorder.saves_pending():
+            self._save_poll_job = self.root.after(100, self._poll_saves)
 
     def run(self):
         self.root.mainloop()
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if sd is None:
-        print("Missing: sounddevice")
-        print("Run: pip install sounddevice")
+        logger.error("Missing: sounddevice")
+        logger.error("Run: pip install sounddevice")
         return
 
-    if keyboard is None:
-        print("Warning: keyboard library not installed - hotkeys will be disabled")
-        print("To enable hotkeys, run: pip install keyboard")
+    if keyboard is None and sys.platform != 'win32':
+        logger.warning("Keyboard library not installed - hotkeys will be disabled")
+        logger.warning("To enable hotkeys, run: pip install keyboard")
 
     app = RecorderApp()
     app.run()
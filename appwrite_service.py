@@ -4,19 +4,49 @@ Appwrite Database Service for Cold Call Transcripts
 Handles storing transcription outputs to Appwrite database.
 """
 
+import hashlib
 import json
 import logging
 import os
-from dataclasses import asdict
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from types import MappingProxyType
 from typing import Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from appwrite.client import Client
+from appwrite.encoders.value_class_encoder import ValueClassEncoder
+from appwrite.input_file import InputFile
 from appwrite.services.tables_db import TablesDB
 from appwrite.id import ID
 from appwrite.exception import AppwriteException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Stored value for an empty list field
+_EMPTY_LIST_JSON = "[]"
+
+
+def _dumps_compact(value) -> str:
+    """Serialize to compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"))
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Collection schema definition - matches Schema.dbml
 # Normalized schema: companies and transcripts in separate tables
 
@@ -81,6 +111,216 @@ NOTES_ATTRIBUTES = [
     {"key": "deleted_at", "type": "string", "size": 30, "required": False},  # ISO datetime
 ]
 
+# Single row recording which schema version setup_database() last applied
+SCHEMA_META_ATTRIBUTES = [
+    {"key": "hash", "type": "string", "size": 64, "required": True},
+]
+SCHEMA_META_ROW_ID = "v1"
+
+# Checksum of all table schemas; setup is skipped while the stored one matches
+SCHEMA_HASH = hashlib.sha256(json.dumps([
+    COMPANIES_ATTRIBUTES,
+    TRANSCRIPTS_ATTRIBUTES,
+    COLDCALLS_ATTRIBUTES,
+    TEAM_MEMBERS_ATTRIBUTES,
+    ALERTS_ATTRIBUTES,
+    NOTES_ATTRIBUTES,
+], sort_keys=True).encode()).hexdigest()
+
+# Writable keys per table, used to filter row data before saving
+COLDCALLS_KEYS = frozenset(attr["key"] for attr in COLDCALLS_ATTRIBUTES)
+COMPANIES_KEYS = frozenset(attr["key"] for attr in COMPANIES_ATTRIBUTES)
+_COMPANY_FIELDS = frozenset(("company_name", "company_location", "google_maps_link"))
+NOTES_KEYS = frozenset(attr["key"] for attr in NOTES_ATTRIBUTES)
+
+# TablesDB method that creates each attribute type
+_COLUMN_CREATORS = {
+    "string": "create_string_column",
+    "integer": "create_integer_column",
+    "boolean": "create_boolean_column",
+}
+
+
+def _column_kwargs(attr: dict) -> dict:
+    """Type-specific create_*_column arguments for a schema attribute."""
+    kwargs = {"key": attr["key"], "required": attr["required"]}
+    if attr["type"] == "string":
+        kwargs["size"] = attr["size"]
+    elif attr["type"] == "integer":
+        if "min" in attr:
+            kwargs["min"] = attr["min"]
+        if "max" in attr:
+            kwargs["max"] = attr["max"]
+    elif attr["type"] == "boolean":
+        kwargs["default"] = attr.get("default", None)
+    return kwargs
+
+
+# Slotted dataclasses need Python 3.10+; on 3.9 instances keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ColumnSpec:
+    """A schema attribute resolved to its TablesDB create_*_column call."""
+    key: str
+    method: str
+    kwargs: MappingProxyType  # Read-only view, so the spec is immutable throughout
+
+
+def _column_specs(attributes: list) -> tuple[ColumnSpec, ...]:
+    return tuple(
+        ColumnSpec(attr["key"], _COLUMN_CREATORS[attr["type"]], MappingProxyType(_column_kwargs(attr)))
+        for attr in attributes
+    )
+
+
+# Column creation calls per table, resolved once at import
+COMPANIES_COLUMNS = _column_specs(COMPANIES_ATTRIBUTES)
+TRANSCRIPTS_COLUMNS = _column_specs(TRANSCRIPTS_ATTRIBUTES)
+COLDCALLS_COLUMNS = _column_specs(COLDCALLS_ATTRIBUTES)
+TEAM_MEMBERS_COLUMNS = _column_specs(TEAM_MEMBERS_ATTRIBUTES)
+ALERTS_COLUMNS = _column_specs(ALERTS_ATTRIBUTES)
+NOTES_COLUMNS = _column_specs(NOTES_ATTRIBUTES)
+SCHEMA_META_COLUMNS = _column_specs(SCHEMA_META_ATTRIBUTES)
+
+
+class _TTLCache:
+    """Small thread-safe cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                # Evict the oldest insertion
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+_pooled_session = None
+_pooled_session_lock = threading.Lock()
+
+
+def get_pooled_session() -> requests.Session:
+    """The process-wide keep-alive session PooledClient instances send through."""
+    global _pooled_session
+    with _pooled_session_lock:
+        if _pooled_session is None:
+            session = requests.Session()
+            # Only idempotent methods are retried (urllib3 default), so a create
+            # is never sent twice; the last response is returned, not raised.
+            retries = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Connection": "keep-alive"})
+            _pooled_session = session
+        return _pooled_session
+
+
+class PooledClient(Client):
+    """
+    Appwrite Client that reuses pooled keep-alive connections.
+
+    The SDK's Client.call uses the module-level requests.request, which opens
+    a new connection (TCP + TLS handshake) for every call. This call() follows
+    the SDK's but sends through `session`, so only this client is affected.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        super().__init__()
+        self._session = session or get_pooled_session()
+
+    def call(self, method, path='', headers=None, params=None, response_type='json'):
+        headers = {**self._global_headers, **(headers or {})}
+        params = params or {}
+        data = {}
+        files = {}
+        stringify = False
+
+        if method != 'get':
+            data = params
+            params = {}
+
+        if headers['content-type'].startswith('application/json'):
+            data = json.dumps(data, cls=ValueClassEncoder)
+
+        if headers['content-type'].startswith('multipart/form-data'):
+            del headers['content-type']
+            stringify = True
+            for key in data.copy():
+                if isinstance(data[key], InputFile):
+                    files[key] = (data[key].filename, data[key].data)
+                    del data[key]
+            data = self.flatten(data, stringify=stringify)
+
+        response = None
+        try:
+            response = self._session.request(
+                method=method,
+                url=self._endpoint + path,
+                params=self.flatten(params, stringify=stringify),
+                data=data,
+                files=files,
+                headers=headers,
+                verify=(not self._self_signed),
+                allow_redirects=response_type != 'location',
+            )
+            response.raise_for_status()
+
+            warnings = response.headers.get('x-appwrite-warning')
+            if warnings:
+                for warning in warnings.split(';'):
+                    logger.warning(f"Appwrite: {warning}")
+
+            if response_type == 'location':
+                return response.headers.get('Location')
+            if response.headers['Content-Type'].startswith('application/json'):
+                return response.json()
+            return response._content
+        except Exception as e:
+            if response is None:
+                raise AppwriteException(e)
+            if response.headers['Content-Type'].startswith('application/json'):
+                body = response.json()
+                raise AppwriteException(body['message'], response.status_code, body.get('type'), response.text)
+            raise AppwriteException(response.text, response.status_code, None, response.text)
+
+
+# How _create_attribute reports each error code: (log, message, attribute exists);
+# message args are (key, server message)
+_ATTR_ERR_HANDLERS = {
+    409: (logger.debug, "Attribute already exists: %s (%s)", True),  # Created concurrently since the column listing
+}
+_ATTR_ERR_DEFAULT = (logger.warning, "Failed to create attribute %s: %s", False)
+
+
 class AppwriteService:
     """Service for interacting with Appwrite database."""
 
@@ -95,13 +335,14 @@ class AppwriteService:
         self.team_members_collection_id = os.getenv("APPWRITE_TEAM_MEMBERS_COLLECTION_ID", "team_members")
         self.alerts_collection_id = os.getenv("APPWRITE_ALERTS_COLLECTION_ID", "alerts")
         self.notes_collection_id = os.getenv("APPWRITE_NOTES_COLLECTION_ID", "notes")
+        self.schema_meta_collection_id = os.getenv("APPWRITE_SCHEMA_META_COLLECTION_ID", "schema_meta")
 
         if not self.project_id or not self.api_key:
             raise ValueError(
                 "Missing Appwrite credentials. Set APPWRITE_PROJECT_ID and APPWRITE_API_KEY in .env"
             )
 
-        self.client = Client()
+        self.client = PooledClient()
         self.client.set_endpoint(self.endpoint)
         self.client.set_project(self.project_id)
         self.client.set_key(self.api_key)
@@ -109,8 +350,32 @@ class AppwriteService:
         # Use TablesDB API (1.8.0+) for all database operations
         self.databases = TablesDB(self.client)
 
+        # Short-lived caches for rows that get_cold_call() re-fetches
+        self._company_cache = _TTLCache()
+        self._transcript_cache = _TTLCache()
+        # (company_name, company_location) -> company ID, most recent last
+        self._company_ids = OrderedDict()
+        self._company_ids_lock = threading.RLock()
+        # Shared by the per-call reads and writes that overlap row requests;
+        # only leaf requests are submitted, so callers can block on the results
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="appwrite")
+
     def setup_database(self) -> bool:
         """Checks for database/collections and creates them if missing. Returns True if successful."""
+        # Collection IDs are configurable, so they are part of the checksum
+        schema_hash = hashlib.sha256(json.dumps([
+            SCHEMA_HASH,
+            self.companies_collection_id,
+            self.transcripts_collection_id,
+            self.coldcalls_collection_id,
+            self.team_members_collection_id,
+            self.alerts_collection_id,
+            self.notes_collection_id,
+        ]).encode()).hexdigest()
+        if self._stored_schema_hash() == schema_hash:
+            logger.info(f"Database schema is up to date: {self.database_id}")
+            return True
+
         try:
             # Check/Create Database
             try:
@@ -126,13 +391,32 @@ class AppwriteService:
                 else:
                     raise
 
-            # Setup Collections (normalized schema)
-            self._setup_collection(self.companies_collection_id, "Companies", COMPANIES_ATTRIBUTES)
-            self._setup_collection(self.transcripts_collection_id, "Transcripts", TRANSCRIPTS_ATTRIBUTES)
-            self._setup_collection(self.coldcalls_collection_id, "ColdCalls", COLDCALLS_ATTRIBUTES)
-            self._setup_collection(self.team_members_collection_id, "TeamMembers", TEAM_MEMBERS_ATTRIBUTES)
-            self._setup_collection(self.alerts_collection_id, "Alerts", ALERTS_ATTRIBUTES)
-            self._setup_collection(self.notes_collection_id, "Notes", NOTES_ATTRIBUTES)
+            # Setup Collections (normalized schema). Tables are independent and
+            # setup is network-bound, so they are checked/created concurrently.
+            collections = [
+                (self.companies_collection_id, "Companies", COMPANIES_COLUMNS),
+                (self.transcripts_collection_id, "Transcripts", TRANSCRIPTS_COLUMNS),
+                (self.coldcalls_collection_id, "ColdCalls", COLDCALLS_COLUMNS),
+                (self.team_members_collection_id, "TeamMembers", TEAM_MEMBERS_COLUMNS),
+                (self.alerts_collection_id, "Alerts", ALERTS_COLUMNS),
+                (self.notes_collection_id, "Notes", NOTES_COLUMNS),
+                (self.schema_meta_collection_id, "SchemaMeta", SCHEMA_META_COLUMNS),
+            ]
+            with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+                futures = [executor.submit(self._setup_collection, *c) for c in collections]
+                # Re-raises the first failure
+                results = [future.result() for future in futures]
+            complete = all(exists for exists, _ in results)
+            created = any(created for _, created in results)
+
+            # Only remember the schema once every column is in place, so a
+            # partial setup is retried on the next start. Columns are created
+            # asynchronously and can't take writes yet (schema_meta.hash
+            # included), so a run that created any leaves it to the next start.
+            if complete and created:
+                logger.info("Created new columns; the schema version will be recorded on the next start")
+            elif complete:
+                self._store_schema_hash(schema_hash)
 
             return True
 
@@ -140,9 +424,38 @@ class AppwriteService:
             logger.error(f"Failed to setup database: {e.message}")
             return False
 
-    def _setup_collection(self, collection_id: str, name: str, attributes: list):
-        """Helper to check/create a collection and its attributes."""
+    def _stored_schema_hash(self) -> Optional[str]:
+        """Returns the schema checksum recorded by the last full setup, if any."""
         try:
+            row = self.databases.get_row(
+                database_id=self.database_id,
+                table_id=self.schema_meta_collection_id,
+                row_id=SCHEMA_META_ROW_ID
+            )
+            return row.get("hash")
+        except AppwriteException:
+            return None  # No database/table/row yet, or unreachable
+
+    def _store_schema_hash(self, schema_hash: str):
+        """Records the applied schema checksum. Failures only cost a full setup next time."""
+        try:
+            self.databases.upsert_row(
+                database_id=self.database_id,
+                table_id=self.schema_meta_collection_id,
+                row_id=SCHEMA_META_ROW_ID,
+                data={"hash": schema_hash}
+            )
+        except AppwriteException as e:
+            logger.warning(f"Failed to record schema version: {e.message}")
+
+    def _setup_collection(self, collection_id: str, name: str,
+                          columns: tuple[ColumnSpec, ...]) -> tuple[bool, bool]:
+        """
+        Helper to check/create a collection and its attributes.
+        Returns (all attributes exist, any attribute was created).
+        """
+        try:
+            created = False
             try:
                 self.databases.get_table(
                     database_id=self.database_id,
@@ -158,55 +471,57 @@ class AppwriteService:
                         permissions=[] # Default permissions, should be configured in Console for security
                     )
                     logger.info(f"Created collection: {name} ({collection_id})")
+                    created = True
                 else:
                     raise
 
-            # Ensure attributes exist
-            self._create_attributes(collection_id, attributes)
+            # Ensure attributes exist; a fresh table has none to look up
+            return self._create_attributes(collection_id, columns, existing=set() if created else None)
 
         except AppwriteException as e:
             logger.error(f"Failed to setup collection {name}: {e.message}")
             raise e
 
-    def _create_attributes(self, collection_id: str, attributes: list):
-        """Creates collection attributes based on schema."""
-        for attr in attributes:
-            try:
-                if attr["type"] == "string":
-                    self.databases.create_string_column(
-                        database_id=self.database_id,
-                        table_id=collection_id,
-                        key=attr["key"],
-                        size=attr["size"],
-                        required=attr["required"]
-                    )
-                elif attr["type"] == "integer":
-                    kwargs = {
-                        "database_id": self.database_id,
-                        "table_id": collection_id,
-                        "key": attr["key"],
-                        "required": attr["required"]
-                    }
-                    if "min" in attr:
-                        kwargs["min"] = attr["min"]
-                    if "max" in attr:
-                        kwargs["max"] = attr["max"]
-                    self.databases.create_integer_column(**kwargs)
-                elif attr["type"] == "boolean":
-                    self.databases.create_boolean_column(
-                        database_id=self.database_id,
-                        table_id=collection_id,
-                        key=attr["key"],
-                        required=attr["required"],
-                        default=attr.get("default", None)
-                    )
-
-                logger.debug(f"Created attribute: {attr['key']}")
-            except AppwriteException as e:
-                if e.code == 409:  # Already exists
-                    logger.debug(f"Attribute already exists: {attr['key']}")
-                else:
-                    logger.warning(f"Failed to create attribute {attr['key']}: {e.message}")
+    def _create_attributes(self, collection_id: str, columns: tuple[ColumnSpec, ...],
+                           existing: Optional[set] = None) -> tuple[bool, bool]:
+        """
+        Creates missing collection attributes based on schema, several requests at a time.
+        Returns (all attributes exist afterwards, any attribute was missing).
+        """
+        if existing is None:
+            existing = self._existing_column_keys(collection_id)
+        columns = [spec for spec in columns if spec.key not in existing]
+        if not columns:
+            return True, False
+        with ThreadPoolExecutor(max_workers=min(16, len(columns))) as executor:
+            futures = [executor.submit(self._create_attribute, collection_id, spec) for spec in columns]
+            # Surface unexpected (non-Appwrite) errors
+            return all([future.result() for future in futures]), True
+
+    def _existing_column_keys(self, collection_id: str) -> set:
+        """Returns the keys of the columns a collection already has."""
+        from appwrite.query import Query
+        result = self.databases.list_columns(
+            database_id=self.database_id,
+            table_id=collection_id,
+            queries=[Query.limit(100)]
+        )
+        return {column["key"] for column in result.get("columns", [])}
+
+    def _create_attribute(self, collection_id: str, spec: ColumnSpec) -> bool:
+        """Creates a single attribute, ignoring ones that already exist. Returns True if it exists."""
+        try:
+            getattr(self.databases, spec.method)(
+                database_id=self.database_id,
+                table_id=collection_id,
+                **spec.kwargs
+            )
+            logger.debug(f"Created attribute: {spec.key}")
+            return True
+        except AppwriteException as e:
+            log, message, exists = _ATTR_ERR_HANDLERS.get(e.code, _ATTR_ERR_DEFAULT)
+            log(message, spec.key, e.message)
+            return exists
 
     def save_call_analysis(self, analysis) -> Optional[str]:
         """
@@ -221,26 +536,34 @@ class AppwriteService:
             ColdCall document ID if successful, None otherwise
         """
         try:
-            # Convert dataclass to dict if needed
+            # Split the analysis into transcript, company and call fields in one
+            # pass, reading dataclass fields directly rather than deep-copying
             if hasattr(analysis, '__dataclass_fields__'):
-                data = asdict(analysis)
+                items = ((f.name, getattr(analysis, f.name)) for f in fields(analysis))
             else:
-                data = dict(analysis)
-
-            # Extract transcript for separate table
-            transcript_text = data.pop("transcript", "")
-            
-            # Extract phone number for company matching (but keep a copy for the call record)
-            phone_number = data.get("phone_number")  # Get, don't pop - we want to keep it
+                items = analysis.items()
+
+            transcript_text = ""
+            company_data = {}
+            data = {}
+            for key, value in items:
+                if value is None:
+                    continue
+                if key == "transcript":
+                    transcript_text = value
+                elif key in _COMPANY_FIELDS:
+                    company_data[key] = value
+                elif key in COLDCALLS_KEYS:
+                    data[key] = value
+
+            # Phone number and owner name stay on the call record but are also
+            # used for company matching
+            phone_number = data.get("phone_number")
+            owner_name = data.get("owner_name")
 
             # Handle company data - find existing or create new company
-            # Copy owner_name for company use, but keep it in data for call record
             company_id = None
-            owner_name = data.get("owner_name")  # Keep in data for call record
-            company_fields = ["company_name", "company_location", "google_maps_link"]
-            company_data = {k: data.pop(k, None) for k in company_fields}
-            company_data = {k: v for k, v in company_data.items() if v is not None}
-            
+
             # Add owner_name to company_data if available
             if owner_name:
                 company_data["owner_name"] = owner_name
@@ -263,43 +586,58 @@ class AppwriteService:
                 data["company_id"] = company_id
 
 
-            # Convert list fields to JSON strings
+            # Convert list fields to compact JSON strings
             for field in ["objections", "pain_points", "follow_up_actions"]:
                 if data.get(field) and isinstance(data[field], list):
-                    data[field] = json.dumps(data[field])
+                    data[field] = _dumps_compact(data[field])
                 elif not data.get(field):
-                    data[field] = "[]"
-
-            # Only keep fields that are defined in the coldcalls schema
-            valid_keys = {attr["key"] for attr in COLDCALLS_ATTRIBUTES}
-            data = {k: v for k, v in data.items() if k in valid_keys}
-
-            # Remove None values
-            data = {k: v for k, v in data.items() if v is not None}
+                    data[field] = _EMPTY_LIST_JSON
 
+            # The call ID is generated client-side so the transcript row can be
+            # written concurrently with the call row instead of after it
+            call_row_id = ID.unique()
+            transcript_row_id = ID.unique()
             # Create coldcall document
-            call_result = self.databases.create_row(
+            call_future = self._executor.submit(
+                self.databases.create_row,
                 database_id=self.database_id,
                 table_id=self.coldcalls_collection_id,
-                row_id=ID.unique(),
+                row_id=call_row_id,
                 data=data
             )
-            call_id = call_result["$id"]
 
             # Create transcript document linked to the call
+            transcript_future = None
             if transcript_text:
                 # Truncate transcript to fit attribute size limit (2000 chars)
                 truncated_transcript = transcript_text[:2000]
-                self.databases.create_row(
+                transcript_future = self._executor.submit(
+                    self.databases.create_row,
                     database_id=self.database_id,
                     table_id=self.transcripts_collection_id,
-                    row_id=ID.unique(),
+                    row_id=transcript_row_id,
                     data={
-                        "call_id": call_id,
+                        "call_id": call_row_id,
                         "transcript": truncated_transcript
                     }
                 )
 
+            # Never leave one row of the pair behind: the caller only marks the
+            # recording processed on success, so a retry would duplicate it
+            try:
+                call_result = call_future.result()
+            except AppwriteException:
+                if transcript_future is not None and transcript_future.exception() is None:
+                    self._delete_orphan_row(self.transcripts_collection_id, transcript_row_id, "transcript")
+                raise
+            if transcript_future is not None:
+                try:
+                    transcript_future.result()
+                except AppwriteException:
+                    self._delete_orphan_row(self.coldcalls_collection_id, call_row_id, "call")
+                    raise
+            call_id = call_result["$id"]
+
             logger.info(f"Saved call to Appwrite: {call_id}")
             return call_id
 
@@ -307,6 +645,17 @@ class AppwriteService:
             logger.error(f"Failed to save call analysis: {e.message}")
             return None
 
+    def _delete_orphan_row(self, table_id: str, row_id: str, kind: str):
+        """Best-effort removal of one row of a call/transcript pair whose other row failed to save."""
+        try:
+            self.databases.delete_row(
+                database_id=self.database_id,
+                table_id=table_id,
+                row_id=row_id
+            )
+        except AppwriteException as e:
+            logger.warning(f"Failed to remove orphan {kind} {row_id}: {e.message}")
+
     # Alias for backwards compatibility
     def save_transcript(self, analysis) -> Optional[str]:
         """Deprecated: Use save_call_analysis instead."""
@@ -314,7 +663,8 @@ class AppwriteService:
 
     def save_company(self, company_data: dict) -> Optional[str]:
         """
-        Creates a new company record.
+        Creates a new company record, or reuses the existing one with the
+        same company_name and company_location.
         
         Args:
             company_data: Dict with company_name (required), owner_name, company_location, google_maps_link
@@ -322,34 +672,76 @@ class AppwriteService:
         Returns:
             Company document ID if successful, None otherwise
         """
-        try:
-            valid_keys = {attr["key"] for attr in COMPANIES_ATTRIBUTES}
-            data = {k: v for k, v in company_data.items() if k in valid_keys and v is not None}
-            
-            result = self.databases.create_row(
-                database_id=self.database_id,
-                table_id=self.companies_collection_id,
-                row_id=ID.unique(),
-                data=data
-            )
-            logger.info(f"Saved company: {result['$id']}")
-            return result["$id"]
-        except AppwriteException as e:
-            logger.error(f"Failed to save company: {e.message}")
-            return None
+        data = {k: v for k, v in company_data.items() if k in COMPANIES_KEYS and v is not None}
+        key = (data.get("company_name"), data.get("company_location"))
+
+        # Held across lookup and create so concurrent savers can't both create
+        with self._company_ids_lock:
+            company_id = self._company_ids.get(key)
+            if company_id:
+                self._company_ids.move_to_end(key)
+                return company_id
+
+            try:
+                existing = self._find_company(*key) if key[0] else None
+                if existing:
+                    company_id = existing["$id"]
+                    logger.info(f"Reusing existing company: {company_id}")
+                else:
+                    result = self.databases.create_row(
+                        database_id=self.database_id,
+                        table_id=self.companies_collection_id,
+                        row_id=ID.unique(),
+                        data=data
+                    )
+                    company_id = result["$id"]
+                    logger.info(f"Saved company: {company_id}")
+            except AppwriteException as e:
+                logger.error(f"Failed to save company: {e.message}")
+                return None
+
+            self._company_ids[key] = company_id
+            if len(self._company_ids) > 1024:
+                self._company_ids.popitem(last=False)
+            return company_id
+
+    def _find_company(self, company_name: str, company_location: Optional[str]) -> Optional[dict]:
+        """Finds a company by exact name and location (a missing location matches null)."""
+        from appwrite.query import Query
+        location_query = (
+            Query.equal("company_location", company_location)
+            if company_location is not None
+            else Query.is_null("company_location")
+        )
+        result = self.databases.list_rows(
+            database_id=self.database_id,
+            table_id=self.companies_collection_id,
+            queries=[Query.equal("company_name", company_name), location_query, Query.limit(1)]
+        )
+        rows = result.get("documents", result.get("rows", []))
+        return rows[0] if rows else None
 
     def get_company(self, company_id: str) -> Optional[dict]:
-        """Retrieves a company by document ID."""
+        """Retrieves a company by document ID (cached for a minute)."""
+        company = self._company_cache.get(company_id)
+        if company is not None:
+            return company
         try:
-            return self.databases.get_row(
+            company = self.databases.get_row(
                 database_id=self.database_id,
                 table_id=self.companies_collection_id,
                 row_id=company_id
             )
+            self._company_cache.set(company_id, company)
+            return company
         except AppwriteException as e:
             logger.error(f"Failed to get company: {e.message}")
             return None
 
+    def invalidate_company(self, company_id: str):
+        """Drops a company from the cache; call after updating it."""
+        self._company_cache.invalidate(company_id)
+
     def find_company_by_phone(self, phone_number: str) -> Optional[dict]:
         """
         Finds a company by phone number.
@@ -392,7 +784,10 @@ class AppwriteService:
             return None
 
     def get_transcript_for_call(self, call_id: str) -> Optional[str]:
-        """Retrieves the transcript text for a given call ID."""
+        """Retrieves the transcript text for a given call ID (cached for a minute)."""
+        transcript = self._transcript_cache.get(call_id)
+        if transcript is not None:
+            return transcript
         try:
             from appwrite.query import Query
             result = self.databases.list_rows(
@@ -402,7 +797,10 @@ class AppwriteService:
             )
             rows = result.get("documents", result.get("rows", []))
             if rows:
-                return rows[0].get("transcript")
+                transcript = rows[0].get("transcript")
+                if transcript is not None:
+                    self._transcript_cache.set(call_id, transcript)
+                return transcript
             return None
         except AppwriteException as e:
             logger.error(f"Failed to get transcript: {e.message}")
@@ -413,6 +811,12 @@ class AppwriteService:
         Retrieves a cold call by document ID, optionally including transcript.
         """
         try:
+            # The transcript is keyed by the call ID we already have, so
+            # fetch it while the call row and its company are loaded
+            transcript_future = None
+            if include_transcript:
+                transcript_future = self._executor.submit(self.get_transcript_for_call, document_id)
+
             doc = self.databases.get_row(
                 database_id=self.database_id,
                 table_id=self.coldcalls_collection_id,
@@ -422,7 +826,7 @@ class AppwriteService:
             # Parse JSON string fields back to lists
             for field in ["objections", "pain_points", "follow_up_actions"]:
                 if doc.get(field):
-                    doc[field] = json.loads(doc[field])
+                    doc[field] = _loads(doc[field])
 
             # Fetch company info if company_id exists
             if doc.get("company_id"):
@@ -430,9 +834,8 @@ class AppwriteService:
                 if company:
                     doc["company"] = company
 
-            # Fetch transcript if requested
-            if include_transcript:
-                doc["transcript"] = self.get_transcript_for_call(document_id) or ""
+            if transcript_future is not None:
+                doc["transcript"] = transcript_future.result() or ""
 
             return doc
         except AppwriteException as e:
@@ -444,18 +847,91 @@ class AppwriteService:
         """Deprecated: Use get_cold_call instead."""
         return self.get_cold_call(document_id)
 
-    def list_cold_calls(self, limit: int = 25) -> list[dict]:
-        """Lists recent cold calls."""
+    def list_cold_calls(self, limit: int = 25, fields: Optional[list[str]] = None) -> list[dict]:
+        """
+        Lists recent cold calls, newest first.
+
+        Args:
+            limit: Maximum number of calls to return
+            fields: Columns to return (e.g. for a list view); all columns if omitted
+        """
         try:
+            from appwrite.query import Query
+            queries = [Query.limit(limit), Query.order_desc("$createdAt")]
+            if fields:
+                queries.append(Query.select(fields))
             result = self.databases.list_rows(
                 database_id=self.database_id,
-                table_id=self.coldcalls_collection_id
+                table_id=self.coldcalls_collection_id,
+                queries=queries
             )
             return result.get("documents", result.get("rows", []))
         except AppwriteException as e:
             logger.error(f"Failed to list cold calls: {e.message}")
             return []
 
+    def list_cold_calls_with_transcripts(self, limit: int = 25) -> list[dict]:
+        """
+        Lists recent cold calls with their company and transcript inlined,
+        like get_cold_call() but for many calls at once.
+
+        Uses three requests in total (calls, then transcripts and companies
+        fetched together by ID list) instead of two extra requests per call.
+        """
+        try:
+            from appwrite.query import Query
+            result = self.databases.list_rows(
+                database_id=self.database_id,
+                table_id=self.coldcalls_collection_id,
+                queries=[Query.limit(limit), Query.order_desc("$createdAt")]
+            )
+            calls = result.get("documents", result.get("rows", []))
+            if not calls:
+                return []
+
+            call_ids = [doc["$id"] for doc in calls]
+            company_ids = list({doc["company_id"] for doc in calls if doc.get("company_id")})
+
+            def list_by(table_id: str, field: str, values: list) -> list[dict]:
+                if not values:
+                    return []
+                rows = self.databases.list_rows(
+                    database_id=self.database_id,
+                    table_id=table_id,
+                    queries=[Query.equal(field, values), Query.limit(len(values))]
+                )
+                return rows.get("documents", rows.get("rows", []))
+
+            transcripts_future = self._executor.submit(
+                list_by, self.transcripts_collection_id, "call_id", call_ids
+            )
+            companies_future = self._executor.submit(
+                list_by, self.companies_collection_id, "$id", company_ids
+            )
+            transcripts = {row["call_id"]: row.get("transcript") for row in transcripts_future.result()}
+            companies = {row["$id"]: row for row in companies_future.result()}
+
+            for doc in calls:
+                # Parse JSON string fields back to lists
+                for field in ["objections", "pain_points", "follow_up_actions"]:
+                    if doc.get(field):
+                        doc[field] = _loads(doc[field])
+
+                company = companies.get(doc.get("company_id"))
+                if company:
+                    doc["company"] = company
+                    self._company_cache.set(company["$id"], company)
+
+                transcript = transcripts.get(doc["$id"])
+                if transcript is not None:
+                    self._transcript_cache.set(doc["$id"], transcript)
+                doc["transcript"] = transcript or ""
+
+            return calls
+        except AppwriteException as e:
+            logger.error(f"Failed to list cold calls: {e.message}")
+            return []
+
     # Alias for backwards compatibility
     def list_transcripts(self, limit: int = 25) -> list[dict]:
         """Deprecated: Use list_cold_calls instead."""
@@ -497,8 +973,7 @@ class AppwriteService:
             Note document ID if successful, None otherwise
         """
         try:
-            valid_keys = {attr["key"] for attr in NOTES_ATTRIBUTES}
-            data = {k: v for k, v in note_data.items() if k in valid_keys and v is not None}
+            data = {k: v for k, v in note_data.items() if k in NOTES_KEYS and v is not None}
             
             # Set defaults for boolean fields
             if "is_archived" not in data:
@@ -542,8 +1017,7 @@ class AppwriteService:
             Updated note document if successful, None otherwise
         """
         try:
-            valid_keys = {attr["key"] for attr in NOTES_ATTRIBUTES}
-            filtered_updates = {k: v for k, v in updates.items() if k in valid_keys}
+            filtered_updates = {k: v for k, v in updates.items() if k in NOTES_KEYS}
             
             result = self.databases.update_row(
                 database_id=self.database_id,
@@ -744,12 +1218,28 @@ class AppwriteService:
             return None
 
 
+_service = None
+_service_lock = threading.Lock()
+
+
 def init_appwrite() -> Optional[AppwriteService]:
-    """Initialize Appwrite service. Returns None if credentials are missing."""
-    try:
-        service = AppwriteService()
-        return service
-    except ValueError as e:
-        logger.warning(str(e))
-        return None
+    """
+    Get the shared Appwrite service, creating it on first use.
+    Returns None if credentials are missing (and retries on the next call).
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            try:
+                _service = AppwriteService()
+            except ValueError as e:
+                logger.warning(str(e))
+        return _service
+
+
+def reset_appwrite():
+    """Forget the shared service so the next init_appwrite() builds a new one."""
+    global _service
+    with _service_lock:
+        _service = None
 
@@ -1,33 +1,32 @@
 
 from dotenv import load_dotenv
 import os
-from appwrite.client import Client
 from appwrite.services.databases import Databases
 
-load_dotenv()
+from appwrite_service import init_appwrite
 
-# Setup Client
-client = Client()
-endpoint = os.getenv('APPWRITE_ENDPOINT') or os.getenv('NEXT_PUBLIC_APPWRITE_ENDPOINT')
-if not endpoint:
-    # Fallback to default commonly used in code
-    endpoint = "https://cloud.appwrite.io/v1"
 
-client.set_endpoint(endpoint)
-client.set_project(os.getenv('APPWRITE_PROJECT_ID'))
-client.set_key(os.getenv('APPWRITE_API_KEY'))
+def fix_permissions():
+    load_dotenv()
 
-databases = Databases(client)
+    # The dashboard's env only defines the public endpoint
+    if not os.getenv('APPWRITE_ENDPOINT') and os.getenv('NEXT_PUBLIC_APPWRITE_ENDPOINT'):
+        os.environ['APPWRITE_ENDPOINT'] = os.environ['NEXT_PUBLIC_APPWRITE_ENDPOINT']
 
-# Configuration from env or defaults
-db_id = os.getenv('APPWRITE_DATABASE_ID', 'ColdCalls')
-team_members_id = os.getenv('APPWRITE_TEAM_MEMBERS_COLLECTION_ID', 'team_members')
+    # Reuse the shared service's pooled client
+    service = init_appwrite()
+    if service is None:
+        print("Error updating permissions: Appwrite credentials are not configured.")
+        return
+
+    databases = Databases(service.client)
+    db_id = service.database_id
+    team_members_id = service.team_members_collection_id
 
-def fix_permissions():
     print(f"Updating permissions for TeamMembers ({team_members_id}) in Database ({db_id})...")
     try:
         # Add read("users") to permissions
-        # Note: existing permissions might be [] or have logic. 
+        # Note: existing permissions might be [] or have logic.
         # But for TeamMembers lookup, 'read("users")' is required.
         databases.update_collection(
             database_id=db_id,
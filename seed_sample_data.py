@@ -6,12 +6,16 @@ Follows normalized Schema.dbml structure (companies, transcripts, coldcalls).
 
 Usage:
     python seed_sample_data.py
+
+Set SEED_RANDOM_SEED to make the generated sample data repeatable.
 """
 
+import itertools
 import json
 import os
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
@@ -25,6 +29,9 @@ load_dotenv()
 # Import setup from appwrite_service
 from appwrite_service import AppwriteService, init_appwrite
 
+# Sample data generator; seeded from SEED_RANDOM_SEED when set, else from OS entropy
+rng = random.Random(os.getenv("SEED_RANDOM_SEED"))
+
 # Sample data for realistic cold calls
 COMPANIES = [
     {"name": "TechCorp Solutions", "location": "San Francisco, CA", "owner": "Michael Chen", "phones": "555-0101,555-0102"},
@@ -63,6 +70,27 @@ FOLLOW_UP_ACTIONS = [
     "Send pricing proposal",
 ]
 
+
+# Most items a sample call puts in one list field
+MAX_LIST_ITEMS = 3
+
+
+def _encoded_samples(pool: list) -> list:
+    """
+    Compact JSON for every ordered selection of up to MAX_LIST_ITEMS from
+    `pool`, grouped by size, so choosing from group k matches
+    json.dumps(rng.sample(pool, k)).
+    """
+    return [
+        [json.dumps(list(selection), separators=(",", ":")) for selection in itertools.permutations(pool, k)]
+        for k in range(min(len(pool), MAX_LIST_ITEMS) + 1)
+    ]
+
+
+OBJECTIONS_JSON = _encoded_samples(OBJECTIONS)
+PAIN_POINTS_JSON = _encoded_samples(PAIN_POINTS)
+FOLLOW_UP_ACTIONS_JSON = _encoded_samples(FOLLOW_UP_ACTIONS)
+
 # Sample transcript templates
 TRANSCRIPT_TEMPLATES = [
     """Caller: Hi, this is {caller} from SalesForce Pro. Am I speaking with {recipient}?
@@ -127,76 +155,98 @@ NOTES = [
 ]
 
 
+# Response pool for each call outcome
+RESPONSE_POOLS = {
+    "Interested": RESPONSES["positive"] + RESPONSES["neutral"],
+    "Callback": RESPONSES["positive"] + RESPONSES["neutral"],
+    "Not Interested": RESPONSES["negative"],
+    "Wrong Number": RESPONSES["negative"],
+}
+
+# Options for the template placeholders that don't depend on the call
+TRANSCRIPT_FILLERS = {
+    "follow_up": [
+        "I completely understand.",
+        "That makes sense.",
+        "I hear that a lot actually.",
+        "That's fair.",
+    ],
+    "closing": [
+        "Would it be okay if I followed up in a couple of weeks?",
+        "Can I send you some information via email?",
+        "Should I schedule a demo for your team?",
+        "Would next week work for a quick call?",
+    ],
+    "final_response": [
+        "Sure, that works.",
+        "Okay, send it over.",
+        "Let me check my calendar.",
+        "I'll think about it.",
+    ],
+    "time_of_day": ["morning", "afternoon"],
+    "industry": ["technology", "healthcare", "manufacturing", "retail"],
+    "pitch": [
+        "We've helped similar companies reduce costs by 30%.",
+        "Our platform integrates seamlessly with existing systems.",
+        "We offer a free trial so you can see the value firsthand.",
+    ],
+    "department": ["sales", "operations", "IT", "procurement"],
+    "reason": [
+        "we're launching a new product",
+        "I noticed your company is growing",
+        "we have a special offer this month",
+    ],
+}
+
+# Interest level range (inclusive) for each call outcome
+INTEREST_RANGES = {
+    "Interested": (7, 10),
+    "Callback": (5, 8),
+    "Not Interested": (1, 4),
+}
+DEFAULT_INTEREST_RANGE = (3, 7)
+
+
+class _TranscriptValues(dict):
+    """Template values that pick a random filler only for placeholders the template uses."""
+
+    def __missing__(self, key):
+        value = self[key] = rng.choice(TRANSCRIPT_FILLERS[key])
+        return value
+
+
 def generate_transcript(company: dict, recipient: str, caller: str, outcome: str) -> str:
     """Generate a realistic call transcript."""
-    template = random.choice(TRANSCRIPT_TEMPLATES)
+    template = rng.choice(TRANSCRIPT_TEMPLATES)
 
     # Select responses based on outcome
-    if outcome in ["Interested", "Callback"]:
-        response_pool = RESPONSES["positive"] + RESPONSES["neutral"]
-    elif outcome in ["Not Interested", "Wrong Number"]:
-        response_pool = RESPONSES["negative"]
-    else:
-        response_pool = RESPONSES["neutral"]
-
-    replacements = {
-        "{caller}": caller,
-        "{recipient}": recipient,
-        "{company}": company["name"],
-        "{response1}": random.choice(response_pool),
-        "{response2}": random.choice(response_pool),
-        "{follow_up}": random.choice([
-            "I completely understand.",
-            "That makes sense.",
-            "I hear that a lot actually.",
-            "That's fair.",
-        ]),
-        "{closing}": random.choice([
-            "Would it be okay if I followed up in a couple of weeks?",
-            "Can I send you some information via email?",
-            "Should I schedule a demo for your team?",
-            "Would next week work for a quick call?",
-        ]),
-        "{final_response}": random.choice([
-            "Sure, that works.",
-            "Okay, send it over.",
-            "Let me check my calendar.",
-            "I'll think about it.",
-        ]),
-        "{time_of_day}": random.choice(["morning", "afternoon"]),
-        "{industry}": random.choice(["technology", "healthcare", "manufacturing", "retail"]),
-        "{pitch}": random.choice([
-            "We've helped similar companies reduce costs by 30%.",
-            "Our platform integrates seamlessly with existing systems.",
-            "We offer a free trial so you can see the value firsthand.",
-        ]),
-        "{department}": random.choice(["sales", "operations", "IT", "procurement"]),
-        "{reason}": random.choice([
-            "we're launching a new product",
-            "I noticed your company is growing",
-            "we have a special offer this month",
-        ]),
-    }
-
-    transcript = template
-    for key, value in replacements.items():
-        transcript = transcript.replace(key, value)
-
-    return transcript
+    response_pool = RESPONSE_POOLS.get(outcome, RESPONSES["neutral"])
+    response1, response2 = rng.choices(response_pool, k=2)
+
+    # Fill every placeholder in a single formatting pass
+    return template.format_map(_TranscriptValues(
+        caller=caller,
+        recipient=recipient,
+        company=company["name"],
+        response1=response1,
+        response2=response2,
+    ))
+
+
+# Call summary for each outcome
+SUMMARY_TEMPLATES = {
+    "Interested": "Positive call with {company}. Prospect showed genuine interest and agreed to next steps.",
+    "Not Interested": "Call with {company} did not result in interest. Prospect declined offer.",
+    "Callback": "Good conversation with {company}. Scheduled callback for follow-up discussion.",
+    "No Answer": "Attempted to reach {company} but no answer. Will retry.",
+    "Wrong Number": "Contact at {company} was incorrect. Need to update records.",
+    "Other": "Call with {company} concluded. Requires further qualification.",
+}
 
 
 def generate_call_summary(company: str, outcome: str, interest: int) -> str:
     """Generate a brief call summary."""
-    summaries = {
-        "Interested": f"Positive call with {company}. Prospect showed genuine interest and agreed to next steps.",
-        "Not Interested": f"Call with {company} did not result in interest. Prospect declined offer.",
-        "Callback": f"Good conversation with {company}. Scheduled callback for follow-up discussion.",
-        "No Answer": f"Attempted to reach {company} but no answer. Will retry.",
-        "Wrong Number": f"Contact at {company} was incorrect. Need to update records.",
-        "Other": f"Call with {company} concluded. Requires further qualification.",
-    }
-
-    base = summaries.get(outcome, f"Call with {company} completed.")
+    base = SUMMARY_TEMPLATES.get(outcome, "Call with {company} completed.").format(company=company)
     if interest >= 7:
         base += " High priority lead."
     elif interest <= 3:
@@ -205,6 +255,66 @@ def generate_call_summary(company: str, outcome: str, interest: int) -> str:
     return base
 
 
+def _company_row(company: dict) -> dict:
+    """Companies row data for a COMPANIES entry."""
+    data = {
+        "company_name": company["name"],
+        "company_location": company["location"],
+        "owner_name": company.get("owner"),
+        "phone_numbers": company.get("phones"),
+        "google_maps_link": f"https://maps.google.com/?q={company['location'].replace(' ', '+')}",
+    }
+    # Remove None values
+    return {k: v for k, v in data.items() if v is not None}
+
+
+def find_existing_rows(databases, database_id: str, table_id: str, field: str, values: list) -> dict:
+    """Maps each of `values` already stored in `field` to its row $id (empty on error)."""
+    from appwrite.query import Query
+    try:
+        result = databases.list_rows(
+            database_id=database_id,
+            table_id=table_id,
+            queries=[Query.equal(field, values), Query.limit(100)]
+        )
+    except AppwriteException as e:
+        print(f"  ! Could not look up existing rows in {table_id}: {e.message}")
+        return {}
+    existing = {}
+    for doc in result.get("documents", result.get("rows", [])):
+        existing.setdefault(doc[field], doc["$id"])
+    return existing
+
+
+def submit_rows(executor, databases, database_id: str, table_id: str, rows: list) -> list:
+    """
+    Starts creating rows on the executor. Returns one future per row, in input
+    order, resolving to the created row or the AppwriteException that failed it.
+    """
+    # Resolved once per batch rather than once per row
+    create_row = databases.create_row
+    new_id = ID.unique
+
+    def create_one(data):
+        try:
+            return create_row(
+                database_id=database_id,
+                table_id=table_id,
+                row_id=new_id(),
+                data=data
+            )
+        except AppwriteException as e:
+            return e
+
+    submit = executor.submit
+    return [submit(create_one, data) for data in rows]
+
+
+def create_rows(executor, databases, database_id: str, table_id: str, rows: list) -> list:
+    """Creates rows concurrently and waits for them. See submit_rows()."""
+    return [future.result() for future in submit_rows(executor, databases, database_id, table_id, rows)]
+
+
 def seed_data():
     """Main function to seed sample data into Appwrite using normalized schema."""
 
@@ -238,29 +348,60 @@ def seed_data():
     alerts_collection = service.alerts_collection_id
     notes_collection = service.notes_collection_id
 
+    # One pool for the whole run; batches that don't depend on each other
+    # (team members and companies, notes and cold calls) are in flight together
+    executor = ThreadPoolExecutor(max_workers=16)
+
     # ========================================
     # Seed Team Members
     # ========================================
     print("\n[1/5] Seeding Team Members...")
     team_member_ids = []
 
+    # Look up rows left by earlier runs so only missing ones are created
+    existing_members_future = executor.submit(
+        find_existing_rows, databases, database_id, team_members_collection,
+        "email", [member["email"] for member in TEAM_MEMBERS]
+    )
+    existing_companies_future = executor.submit(
+        find_existing_rows, databases, database_id, companies_collection,
+        "company_name", [company["name"] for company in COMPANIES]
+    )
+    existing_members = existing_members_future.result()
+    existing_companies = existing_companies_future.result()
+
+    new_members = [member for member in TEAM_MEMBERS if member["email"] not in existing_members]
+    rows = [
+        {
+            "name": member["name"],
+            "email": member["email"],
+            "role": member["role"],
+        }
+        for member in new_members
+    ]
+    team_member_futures = dict(zip(
+        (member["email"] for member in new_members),
+        submit_rows(executor, databases, database_id, team_members_collection, rows)
+    ))
+    new_companies = [company for company in COMPANIES if company["name"] not in existing_companies]
+    company_futures = dict(zip(
+        (company["name"] for company in new_companies),
+        submit_rows(executor, databases, database_id, companies_collection, [
+            _company_row(company) for company in new_companies
+        ])
+    ))
+
     for member in TEAM_MEMBERS:
-        try:
-            doc_id = ID.unique()
-            result = databases.create_row(
-                database_id=database_id,
-                table_id=team_members_collection,
-                row_id=doc_id,
-                data={
-                    "name": member["name"],
-                    "email": member["email"],
-                    "role": member["role"],
-                }
-            )
-            team_member_ids.append(result["$id"])
-            print(f"  + Created team member: {member['name']} ({result['$id']})")
-        except AppwriteException as e:
-            print(f"  ! Failed to create team member {member['name']}: {e.message}")
+        if member["email"] in existing_members:
+            team_member_ids.append(existing_members[member["email"]])
+            print(f"  = Using existing team member: {member['name']} ({existing_members[member['email']]})")
+            continue
+        result = team_member_futures[member["email"]].result()
+        if isinstance(result, AppwriteException):
+            print(f"  ! Failed to create team member {member['name']}: {result.message}")
+            continue
+        team_member_ids.append(result["$id"])
+        print(f"  + Created team member: {member['name']} ({result['$id']})")
 
     if not team_member_ids:
         print("  ! No team members created. Trying to fetch existing ones...")
@@ -275,6 +416,21 @@ def seed_data():
         except AppwriteException as e:
             print(f"  ! Could not fetch team members: {e.message}")
 
+    # Notes only need team members
+    note_futures = []
+    if team_member_ids:
+        rows = [
+            {
+                "title": note["title"],
+                "note_text": note["text"],
+                "created_by": rng.choice(team_member_ids),
+                "is_archived": False,
+                "is_deleted": False,
+            }
+            for note in NOTES
+        ]
+        note_futures = submit_rows(executor, databases, database_id, notes_collection, rows)
+
     # ========================================
     # Seed Companies
     # ========================================
@@ -282,27 +438,16 @@ def seed_data():
     company_id_map = {}  # Maps company name to $id
 
     for company in COMPANIES:
-        try:
-            data = {
-                "company_name": company["name"],
-                "company_location": company["location"],
-                "owner_name": company.get("owner"),
-                "phone_numbers": company.get("phones"),
-                "google_maps_link": f"https://maps.google.com/?q={company['location'].replace(' ', '+')}",
-            }
-            # Remove None values
-            data = {k: v for k, v in data.items() if v is not None}
-
-            result = databases.create_row(
-                database_id=database_id,
-                table_id=companies_collection,
-                row_id=ID.unique(),
-                data=data
-            )
-            company_id_map[company["name"]] = result["$id"]
-            print(f"  + Created company: {company['name']} ({result['$id']})")
-        except AppwriteException as e:
-            print(f"  ! Failed to create company {company['name']}: {e.message}")
+        if company["name"] in existing_companies:
+            company_id_map[company["name"]] = existing_companies[company["name"]]
+            print(f"  = Using existing company: {company['name']} ({existing_companies[company['name']]})")
+            continue
+        result = company_futures[company["name"]].result()
+        if isinstance(result, AppwriteException):
+            print(f"  ! Failed to create company {company['name']}: {result.message}")
+            continue
+        company_id_map[company["name"]] = result["$id"]
+        print(f"  + Created company: {company['name']} ({result['$id']})")
 
     # ========================================
     # Seed Cold Calls + Transcripts
@@ -312,39 +457,36 @@ def seed_data():
 
     num_calls = 5  # Number of sample calls to create
 
-    for i in range(num_calls):
-        company = random.choice(COMPANIES)
-        recipient = random.choice(RECIPIENTS)
-        caller = random.choice(CALLERS)
-        outcome = random.choice(CALL_OUTCOMES)
-
+    # Draw every call's random data up front, then create the rows together
+    calls = []  # (label, call row data, transcript)
+    claim_pool = team_member_ids + [None, None]
+    draws = zip(
+        rng.choices(COMPANIES, k=num_calls),
+        rng.choices(RECIPIENTS, k=num_calls),
+        rng.choices(CALLERS, k=num_calls),
+        rng.choices(CALL_OUTCOMES, k=num_calls),
+    )
+    for company, recipient, caller, outcome in draws:
         # Interest level correlates somewhat with outcome
-        if outcome == "Interested":
-            interest = random.randint(7, 10)
-        elif outcome == "Callback":
-            interest = random.randint(5, 8)
-        elif outcome == "Not Interested":
-            interest = random.randint(1, 4)
-        else:
-            interest = random.randint(3, 7)
+        interest = rng.randint(*INTEREST_RANGES.get(outcome, DEFAULT_INTEREST_RANGE))
 
         # Generate transcript
         transcript = generate_transcript(company, recipient, caller, outcome)
 
         # Generate JSON arrays for list fields
-        num_objections = random.randint(0, 3) if outcome in ["Not Interested", "Callback"] else 0
-        num_pain_points = random.randint(1, 3) if outcome in ["Interested", "Callback"] else random.randint(0, 1)
-        num_follow_ups = random.randint(1, 3) if outcome in ["Interested", "Callback"] else random.randint(0, 1)
+        num_objections = rng.randint(0, MAX_LIST_ITEMS) if outcome in ["Not Interested", "Callback"] else 0
+        num_pain_points = rng.randint(1, MAX_LIST_ITEMS) if outcome in ["Interested", "Callback"] else rng.randint(0, 1)
+        num_follow_ups = rng.randint(1, MAX_LIST_ITEMS) if outcome in ["Interested", "Callback"] else rng.randint(0, 1)
 
-        objections = json.dumps(random.sample(OBJECTIONS, min(num_objections, len(OBJECTIONS))))
-        pain_points = json.dumps(random.sample(PAIN_POINTS, min(num_pain_points, len(PAIN_POINTS))))
-        follow_up_actions = json.dumps(random.sample(FOLLOW_UP_ACTIONS, min(num_follow_ups, len(FOLLOW_UP_ACTIONS))))
+        objections = rng.choice(OBJECTIONS_JSON[min(num_objections, len(OBJECTIONS_JSON) - 1)])
+        pain_points = rng.choice(PAIN_POINTS_JSON[min(num_pain_points, len(PAIN_POINTS_JSON) - 1)])
+        follow_up_actions = rng.choice(FOLLOW_UP_ACTIONS_JSON[min(num_follow_ups, len(FOLLOW_UP_ACTIONS_JSON) - 1)])
 
         # Random claimed_by (some calls are unclaimed)
-        claimed_by = random.choice(team_member_ids + [None, None]) if team_member_ids else None
+        claimed_by = rng.choice(claim_pool) if team_member_ids else None
 
         # Random duration
-        duration_mins = random.randint(1, 15)
+        duration_mins = rng.randint(1, 15)
 
         # Get company_id from our created companies
         company_id = company_id_map.get(company["name"])
@@ -374,31 +516,46 @@ def seed_data():
         # Remove None values
         data = {k: v for k, v in data.items() if v is not None}
 
+        calls.append((f"{company['name']} - {outcome} (Interest: {interest})", data, transcript))
+
+    # Create each cold call, then its transcript in a separate table as soon
+    # as the call's ID is known, without waiting for the other calls
+    def create_call(data: dict, transcript: str):
+        """Returns (call row or AppwriteException, transcript AppwriteException or None)."""
         try:
-            # Create cold call
-            call_result = databases.create_row(
+            call = databases.create_row(
                 database_id=database_id,
                 table_id=coldcalls_collection,
                 row_id=ID.unique(),
                 data=data
             )
-            call_id = call_result["$id"]
-            cold_call_ids.append(call_id)
-
-            # Create transcript in separate table
+        except AppwriteException as e:
+            return e, None
+        try:
             databases.create_row(
                 database_id=database_id,
                 table_id=transcripts_collection,
                 row_id=ID.unique(),
                 data={
-                    "call_id": call_id,
+                    "call_id": call["$id"],
                     "transcript": transcript[:16000],  # 16KB limit
                 }
             )
-
-            print(f"  + Created call #{i+1}: {company['name']} - {outcome} (Interest: {interest})")
         except AppwriteException as e:
-            print(f"  ! Failed to create call #{i+1}: {e.message}")
+            return call, e
+        return call, None
+
+    call_futures = [executor.submit(create_call, data, transcript) for _, data, transcript in calls]
+    for i, ((label, _, _), future) in enumerate(zip(calls, call_futures)):
+        call, transcript_error = future.result()
+        if isinstance(call, AppwriteException):
+            print(f"  ! Failed to create call #{i+1}: {call.message}")
+            continue
+        cold_call_ids.append(call["$id"])
+        if transcript_error is not None:
+            print(f"  ! Failed to create transcript for call #{i+1}: {transcript_error.message}")
+            continue
+        print(f"  + Created call #{i+1}: {label}")
 
     # ========================================
     # Seed Alerts
@@ -409,7 +566,7 @@ def seed_data():
     if team_member_ids and cold_call_ids:
         # Create some sample alerts
         num_alerts_to_create = min(8, len(cold_call_ids))
-        sample_calls = random.sample(cold_call_ids, num_alerts_to_create)
+        sample_calls = rng.sample(cold_call_ids, num_alerts_to_create)
 
         alert_messages = [
             "Follow up with this lead ASAP",
@@ -422,14 +579,15 @@ def seed_data():
             "Hot lead - close this week",
         ]
 
+        rows = []
         for i, call_id in enumerate(sample_calls):
-            creator = random.choice(team_member_ids)
-            target = random.choice(team_member_ids)
+            creator = rng.choice(team_member_ids)
+            target = rng.choice(team_member_ids)
 
             # Some alerts are instant, some are scheduled
-            if random.random() > 0.5:
+            if rng.random() > 0.5:
                 # Scheduled alert (1-7 days from now)
-                alert_time = (datetime.now() + timedelta(days=random.randint(1, 7))).isoformat()
+                alert_time = (datetime.now() + timedelta(days=rng.randint(1, 7))).isoformat()
             else:
                 alert_time = None
 
@@ -440,23 +598,20 @@ def seed_data():
                 "entity_id": call_id,
                 "entity_label": f"Call #{i+1}",
                 "message": alert_messages[i % len(alert_messages)],
-                "is_dismissed": random.choice([True, False, False, False]),  # 25% dismissed
+                "is_dismissed": rng.choice([True, False, False, False]),  # 25% dismissed
             }
 
             if alert_time:
                 data["alert_time"] = alert_time
 
-            try:
-                result = databases.create_row(
-                    database_id=database_id,
-                    table_id=alerts_collection,
-                    row_id=ID.unique(),
-                    data=data
-                )
-                alerts_created += 1
-                print(f"  + Created alert: {data['message'][:40]}...")
-            except AppwriteException as e:
-                print(f"  ! Failed to create alert: {e.message}")
+            rows.append(data)
+
+        for data, result in zip(rows, create_rows(executor, databases, database_id, alerts_collection, rows)):
+            if isinstance(result, AppwriteException):
+                print(f"  ! Failed to create alert: {result.message}")
+                continue
+            alerts_created += 1
+            print(f"  + Created alert: {data['message'][:40]}...")
     else:
         print("  ! Skipping alerts - need team members and calls first")
 
@@ -466,32 +621,19 @@ def seed_data():
     print("\n[5/6] Seeding Notes...")
     notes_created = 0
 
-    if team_member_ids:
-        for note in NOTES:
-            creator = random.choice(team_member_ids)
-            
-            data = {
-                "title": note["title"],
-                "note_text": note["text"],
-                "created_by": creator,
-                "is_archived": False,
-                "is_deleted": False,
-            }
-
-            try:
-                result = databases.create_row(
-                    database_id=database_id,
-                    table_id=notes_collection,
-                    row_id=ID.unique(),
-                    data=data
-                )
-                notes_created += 1
-                print(f"  + Created note: {note['title']}")
-            except AppwriteException as e:
-                print(f"  ! Failed to create note {note['title']}: {e.message}")
+    if note_futures:
+        for note, future in zip(NOTES, note_futures):
+            result = future.result()
+            if isinstance(result, AppwriteException):
+                print(f"  ! Failed to create note {note['title']}: {result.message}")
+                continue
+            notes_created += 1
+            print(f"  + Created note: {note['title']}")
     else:
         print("  ! Skipping notes - need team members first")
 
+    executor.shutdown()
+
     # ========================================
     # Summary
     # ========================================
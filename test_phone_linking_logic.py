@@ -1,3 +1,5 @@
+import copy
+import importlib
 import unittest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
@@ -11,20 +13,59 @@ logging.basicConfig(level=logging.INFO)
 # Assuming the script is run from the project root
 from transcribe_calls import extract_phone_from_filename, CallAnalysis
 
-# We need to mock the Appwrite dependencies for AppwriteService
-# because we don't want to connect to real Appwrite
-sys.modules['appwrite'] = MagicMock()
-sys.modules['appwrite.client'] = MagicMock()
-sys.modules['appwrite.services.databases'] = MagicMock()
-sys.modules['appwrite.id'] = MagicMock()
-sys.modules['appwrite.exception'] = MagicMock()
-sys.modules['appwrite.query'] = MagicMock()
+import appwrite_service
+
+# Set by setUpModule to the class from appwrite_service loaded against the mocks
+AppwriteService = None
+_appwrite_patch = None
+
+
+def setUpModule():
+    # We need to mock the Appwrite dependencies for AppwriteService
+    # because we don't want to connect to real Appwrite. The mocks only
+    # live in sys.modules while this module's tests run.
+    global AppwriteService, _appwrite_patch
+    mock_exception = MagicMock()
+    mock_exception.AppwriteException = type("AppwriteException", (Exception,), {})
+    _appwrite_patch = patch.dict(sys.modules, {
+        'appwrite': MagicMock(),
+        'appwrite.client': MagicMock(),
+        'appwrite.services': MagicMock(),
+        'appwrite.services.tables_db': MagicMock(),
+        'appwrite.id': MagicMock(),
+        'appwrite.exception': mock_exception,
+        'appwrite.query': MagicMock(),
+    })
+    _appwrite_patch.start()
+    AppwriteService = importlib.reload(appwrite_service).AppwriteService
+
+
+def tearDownModule():
+    # Restore the real SDK and rebind appwrite_service to it
+    _appwrite_patch.stop()
+    importlib.reload(appwrite_service)
+
+def mock_env_vars(key, default=None):
+    if key == "APPWRITE_ENDPOINT":
+        return "https://cloud.appwrite.io/v1"
+    elif "APPWRITE" in key:
+        return "test_val"
+    return default
 
-# Now import AppwriteService
-from appwrite_service import AppwriteService
 
 class TestPhoneLinking(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Build the service once; each test works on a shallow copy
+        with patch('os.getenv', side_effect=mock_env_vars):
+            cls.service_template = AppwriteService()
+
+    def make_service(self):
+        service = copy.copy(self.service_template)
+        service.databases = MagicMock()
+        return service
+
     def test_extract_phone_from_filename(self):
         """Test extraction of phone numbers from filenames."""
         print("\n--- Testing extract_phone_from_filename ---")
@@ -54,24 +95,12 @@ class TestPhoneLinking(unittest.TestCase):
         self.assertIsNone(extract_phone_from_filename(f5))
         print(f"Passed: {f5} -> None")
 
-    @patch('os.getenv')
-    def test_find_company_by_phone(self, mock_getenv):
+    def test_find_company_by_phone(self):
         """Test logic for finding company by phone."""
         print("\n--- Testing find_company_by_phone ---")
         
-        # Setup env vars mock
-        def mock_env_vars(key, default=None):
-            if key == "APPWRITE_ENDPOINT":
-                return "https://cloud.appwrite.io/v1"
-            elif "APPWRITE" in key:
-                return "test_val"
-            return default
-            
-        mock_getenv.side_effect = mock_env_vars
-        
         # Setup mocking
-        service = AppwriteService()
-        service.databases = MagicMock()
+        service = self.make_service()
         service.database_id = "test_db"
         service.companies_collection_id = "test_companies"
         
@@ -121,33 +150,28 @@ class TestPhoneLinking(unittest.TestCase):
         print("Passed: No company found")
 
     @patch('appwrite_service.ID')
-    @patch('os.getenv')
-    def test_save_call_analysis_linking(self, mock_getenv, mock_id_cls):
+    def test_save_call_analysis_linking(self, mock_id_cls):
         """Test save_call_analysis links to existing company."""
         print("\n--- Testing save_call_analysis linking ---")
         
-        # Setup env vars mock
-        def mock_env_vars(key, default=None):
-            if key == "APPWRITE_ENDPOINT":
-                return "https://cloud.appwrite.io/v1"
-            elif "APPWRITE" in key:
-                return "test_val"
-            return default
-            
-        mock_getenv.side_effect = mock_env_vars
-        
         # Setup mocking
         mock_id_cls.unique.return_value = "unique_id"
         
-        service = AppwriteService()
-        service.databases = MagicMock() # Reset mock
+        service = self.make_service()
         service.find_company_by_phone = MagicMock()
         service.save_company = MagicMock()
         service.coldcalls_collection_id = "coldcalls"
         service.transcripts_collection_id = "transcripts"
         
-        # Fake Create Result
-        service.databases.create_row.return_value = {"$id": "new_call_id"}
+        # Fake Create Result, recording each row's data by table
+        recorded = {}
+        create_result = {"$id": "new_call_id"}
+
+        def record_create_row(**kwargs):
+            recorded[kwargs['table_id']] = kwargs['data']
+            return create_result
+
+        service.databases.create_row.side_effect = record_create_row
 
         # Case 1: Phone number matches existing company
         phone = "5555555555"
@@ -171,23 +195,14 @@ class TestPhoneLinking(unittest.TestCase):
         service.save_company.assert_not_called()
         
         # Verify create_row linked to new company
-        # Iterate through calls to find the one for coldcalls table
-        calls = service.databases.create_row.call_args_list
-        found_data = None
-        for call in calls:
-            _, kwargs = call
-            if kwargs.get('table_id') == "coldcalls":
-                found_data = kwargs['data']
-                break
-        
-        self.assertIsNotNone(found_data, "ColdCall create_row not called")
-        self.assertEqual(found_data['company_id'], "existing_company_id")
+        self.assertIn("coldcalls", recorded, "ColdCall create_row not called")
+        self.assertEqual(recorded["coldcalls"]['company_id'], "existing_company_id")
         print("Passed: Linked to existing company by phone")
 
         # Reset mocks
         service.find_company_by_phone.reset_mock()
         service.save_company.reset_mock()
-        service.databases.create_row.reset_mock()
+        recorded.clear()
 
         # Case 2: Phone number provided but NO existing company
         phone = "9999999999"
@@ -199,7 +214,7 @@ class TestPhoneLinking(unittest.TestCase):
         
         service.find_company_by_phone.return_value = None
         service.save_company.return_value = "new_company_id" # mocked creation of company
-        service.databases.create_row.return_value = {"$id": "new_call_id_2"}
+        create_result = {"$id": "new_call_id_2"}
 
         call_id = service.save_call_analysis(analysis)
 
@@ -216,18 +231,87 @@ class TestPhoneLinking(unittest.TestCase):
         self.assertEqual(company_data_arg['company_name'], "New Company")
         
         # Verify create_row linked to new company
-        # Iterate through calls to find the one for coldcalls table
-        calls = service.databases.create_row.call_args_list
-        found_data = None
-        for call in calls:
-            _, kwargs = call
-            if kwargs.get('table_id') == "coldcalls":
-                found_data = kwargs['data']
-                break
-                
-        self.assertIsNotNone(found_data, "ColdCall create_row not called")
-        self.assertEqual(found_data['company_id'], "new_company_id")
+        self.assertIn("coldcalls", recorded, "ColdCall create_row not called")
+        self.assertEqual(recorded["coldcalls"]['company_id'], "new_company_id")
         print("Passed: Created new company with phone number")
 
+    @patch('appwrite_service.ID')
+    def test_save_call_analysis_removes_half_saved_pair(self, mock_id_cls):
+        """Test save_call_analysis deletes the row that saved when its partner failed."""
+        print("\n--- Testing save_call_analysis cleanup ---")
+
+        mock_id_cls.unique.side_effect = ["call_row", "transcript_row"] * 2
+        service = self.make_service()
+        service.find_company_by_phone = MagicMock(return_value={"$id": "company_id"})
+        service.coldcalls_collection_id = "coldcalls"
+        service.transcripts_collection_id = "transcripts"
+        analysis = CallAnalysis(transcript="Hello", phone_number="5555555555")
+
+        def failing_create_row(failing_table):
+            def create_row(**kwargs):
+                if kwargs['table_id'] == failing_table:
+                    error = appwrite_service.AppwriteException("boom")
+                    error.message = "boom"
+                    raise error
+                return {"$id": kwargs['row_id']}
+            return create_row
+
+        # Transcript fails: the call row must not stay behind
+        service.databases.create_row.side_effect = failing_create_row("transcripts")
+        self.assertIsNone(service.save_call_analysis(analysis))
+        service.databases.delete_row.assert_called_once_with(
+            database_id=service.database_id, table_id="coldcalls", row_id="call_row"
+        )
+        print("Passed: Call row removed when transcript failed")
+
+        # Call fails: the transcript row must not stay behind
+        service.databases.delete_row.reset_mock()
+        service.databases.create_row.side_effect = failing_create_row("coldcalls")
+        self.assertIsNone(service.save_call_analysis(analysis))
+        service.databases.delete_row.assert_called_once_with(
+            database_id=service.database_id, table_id="transcripts", row_id="transcript_row"
+        )
+        print("Passed: Transcript row removed when call failed")
+
+    def test_setup_database_records_schema_after_columns_exist(self):
+        """Test setup_database only records the schema checksum once no columns were just created."""
+        print("\n--- Testing setup_database schema checksum ---")
+
+        def not_found(*args, **kwargs):
+            error = appwrite_service.AppwriteException("not found")
+            error.code = 404
+            error.message = "not found"
+            raise error
+
+        # Fresh database: every table and column is created, nothing recorded yet
+        service = self.make_service()
+        service.databases.get_row.side_effect = not_found
+        service.databases.get_table.side_effect = not_found
+        self.assertTrue(service.setup_database())
+        service.databases.create_string_column.assert_called()
+        service.databases.upsert_row.assert_not_called()
+        print("Passed: Checksum not written on the run that created columns")
+
+        # Next start: everything exists, so the checksum is recorded
+        service = self.make_service()
+        service.databases.get_row.side_effect = not_found
+        # (The mocked environment gives every table the same ID, so list every column)
+        all_columns = [
+            {"key": spec.key}
+            for columns in (
+                appwrite_service.COMPANIES_COLUMNS, appwrite_service.TRANSCRIPTS_COLUMNS,
+                appwrite_service.COLDCALLS_COLUMNS, appwrite_service.TEAM_MEMBERS_COLUMNS,
+                appwrite_service.ALERTS_COLUMNS, appwrite_service.NOTES_COLUMNS,
+                appwrite_service.SCHEMA_META_COLUMNS,
+            )
+            for spec in columns
+        ]
+        service.databases.list_columns.return_value = {"columns": all_columns}
+        self.assertTrue(service.setup_database())
+        service.databases.create_string_column.assert_not_called()
+        service.databases.upsert_row.assert_called_once()
+        print("Passed: Checksum written once all columns exist")
+
+
 if __name__ == '__main__':
     unittest.main()
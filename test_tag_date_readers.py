@@ -0,0 +1,117 @@
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from transcribe_calls import _read_id3_tdrc, _read_mp4_day
+
+
+def syncsafe(n):
+    """Encodes n as a 4-byte ID3 syncsafe integer."""
+    return bytes([(n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F])
+
+
+def id3_frame(version, frame_id, payload):
+    size = syncsafe(len(payload)) if version == 4 else struct.pack('>I', len(payload))
+    return frame_id + size + b'\0\0' + payload
+
+
+def id3_tag(version, frames, padding=0, extended_header=None):
+    """Builds an ID3v2 tag followed by some fake MPEG audio."""
+    flags = 0x40 if extended_header is not None else 0
+    body = (extended_header or b'') + b''.join(frames) + b'\0' * padding
+    return b'ID3' + bytes([version, 0, flags]) + syncsafe(len(body)) + body + b'\xff\xfb' * 64
+
+
+def atom(kind, payload):
+    return struct.pack('>I', 8 + len(payload)) + kind + payload
+
+
+def m4a_file(day):
+    """Builds a minimal M4A with ©day at moov/udta/meta/ilst, behind an mdat atom."""
+    data = atom(b'data', b'\0\0\0\x01' + b'\0\0\0\0' + day.encode('utf-8'))
+    ilst = atom(b'ilst', atom(b'\xa9nam', atom(b'data', b'\0' * 8 + b'Title')) + atom(b'\xa9day', data))
+    meta = atom(b'meta', b'\0\0\0\0' + atom(b'hdlr', b'\0' * 25) + ilst)
+    moov = atom(b'moov', atom(b'mvhd', b'\0' * 100) + atom(b'udta', meta))
+    return atom(b'ftyp', b'M4A \0\0\0\0') + atom(b'mdat', b'\0' * 256) + moov
+
+
+class TestTagDateReaders(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, name, data):
+        path = Path(self._tmp.name) / name
+        path.write_bytes(data)
+        return path
+
+    def test_id3v23_tdrc_after_other_frames(self):
+        frames = [
+            id3_frame(3, b'TIT2', b'\x00Call'),
+            id3_frame(3, b'TDRC', b'\x00' + b'2023-10-27T14:30:00'),
+        ]
+        path = self.write('v23.mp3', id3_tag(3, frames, padding=32))
+        self.assertEqual(_read_id3_tdrc(path), '2023-10-27T14:30:00')
+
+    def test_id3v24_with_extended_header(self):
+        # v2.4 extended header: syncsafe size (including itself), flag byte count, flags
+        extended = syncsafe(6) + b'\x01\x00'
+        frames = [id3_frame(4, b'TDRC', b'\x03' + b'2024-02-03T04:05:06\x00')]
+        path = self.write('v24.mp3', id3_tag(4, frames, extended_header=extended))
+        self.assertEqual(_read_id3_tdrc(path), '2024-02-03T04:05:06')
+
+    def test_id3v23_with_extended_header(self):
+        # v2.3 extended header: size excluding itself, flags, padding size
+        extended = struct.pack('>I', 6) + b'\0\0' + b'\0\0\0\0'
+        frames = [id3_frame(3, b'TDRC', b'\x00' + b'2022')]
+        path = self.write('ext23.mp3', id3_tag(3, frames, extended_header=extended))
+        self.assertEqual(_read_id3_tdrc(path), '2022')
+
+    def test_id3_utf16_text(self):
+        frames = [id3_frame(4, b'TDRC', b'\x01' + '2023-10-27'.encode('utf-16'))]
+        path = self.write('utf16.mp3', id3_tag(4, frames))
+        self.assertEqual(_read_id3_tdrc(path), '2023-10-27')
+
+    def test_id3_padding_before_tdrc_stops_the_scan(self):
+        frames = [id3_frame(3, b'TIT2', b'\x00Call')]
+        path = self.write('padded.mp3', id3_tag(3, frames, padding=64))
+        self.assertIsNone(_read_id3_tdrc(path))
+
+    def test_id3_truncated_tdrc_payload(self):
+        frames = [id3_frame(3, b'TDRC', b'\x00' + b'2023-10-27T14:30:00')]
+        data = id3_tag(3, frames)
+        path = self.write('truncated.mp3', data[:data.index(b'TDRC') + 10 + 12])
+        self.assertIsNone(_read_id3_tdrc(path))
+
+    def test_not_id3(self):
+        path = self.write('plain.mp3', b'\xff\xfb' * 64)
+        self.assertIsNone(_read_id3_tdrc(path))
+
+    def test_mp4_day(self):
+        path = self.write('call.m4a', m4a_file('2024-01-05T09:08:07Z'))
+        self.assertEqual(_read_mp4_day(path), '2024-01-05T09:08:07Z')
+
+    def test_mp4_without_day(self):
+        meta = atom(b'meta', b'\0\0\0\0' + atom(b'ilst', atom(b'\xa9nam', atom(b'data', b'\0' * 8 + b'x'))))
+        path = self.write('noday.m4a', atom(b'ftyp', b'M4A ') + atom(b'moov', atom(b'udta', meta)))
+        self.assertIsNone(_read_mp4_day(path))
+
+    def test_mp4_truncated_day(self):
+        data = m4a_file('2024-01-05T09:08:07Z')
+        path = self.write('truncated.m4a', data[:-10])
+        self.assertIsNone(_read_mp4_day(path))
+
+    def test_mp4_truncated_atom_header(self):
+        data = m4a_file('2024-01-05T09:08:07Z')
+        path = self.write('header.m4a', data[:data.index(b'moov') + 2])
+        self.assertIsNone(_read_mp4_day(path))
+
+    def test_empty_files(self):
+        self.assertIsNone(_read_id3_tdrc(self.write('empty.mp3', b'')))
+        self.assertIsNone(_read_mp4_day(self.write('empty.m4a', b'')))
+
+
+if __name__ == '__main__':
+    unittest.main()
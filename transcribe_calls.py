@@ -6,16 +6,26 @@ actionable insights including call outcomes, objections, and follow-ups.
 """
 
 import argparse
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
 import re
+import shutil
+import struct
+import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import mutagen
 from dotenv import load_dotenv
@@ -23,6 +33,11 @@ from google import genai
 
 from appwrite_service import init_appwrite
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 # Configure logging
@@ -33,14 +48,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Supported audio formats
-AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".ogg", ".flac", ".aac", ".wma"}
+# JSON parsing, using orjson when available (its errors subclass json.JSONDecodeError)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_pretty(value) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Characters not allowed in filenames, runs of underscores, and the outermost
+# JSON object in a model response
+_FILENAME_UNSAFE_RE = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORES_RE = re.compile(r'_+')
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Fractional seconds in ffprobe timestamps (2023-10-27T14:30:00.000000Z)
+_FRACTIONAL_SECONDS_RE = re.compile(r'(T\d{2}:\d{2}:\d{2})\.\d+')
+
+# Date formats found in recording tags, e.g. 2023-10-27T14:30:00 or 2023-10-27
+_TAG_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",  # ISO with timezone
+    "%Y-%m-%dT%H:%M:%SZ",   # ISO UTC
+    "%Y-%m-%dT%H:%M:%S",    # ISO simple
+    "%Y-%m-%d %H:%M",       # Simple date time
+    "%Y-%m-%d",             # Date only
+    "%Y",                   # Year only
+)
+
+# Supported audio formats, lowercase; match against suffix.lower()
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg", ".flac", ".aac", ".wma"})
+
+# Formats whose date tag is read directly as an MP4 ©day atom
+_MP4_EXTENSIONS = frozenset({".m4a", ".mp4", ".aac"})
+
+# ffprobe, if installed, reads date tags from formats mutagen handles poorly (e.g. WAV INFO chunks)
+FFPROBE = shutil.which("ffprobe")
+FFPROBE_TIMEOUT = 10  # seconds
 
 # File to track processed recordings (prevents re-transcription)
 PROCESSED_RECORDINGS_FILE = "processed_recordings.txt"
 
+# Batch Mode job polling: first wait and cap (seconds), doubling in between
+BATCH_POLL_INITIAL = 10
+BATCH_POLL_MAX = 300
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+class RateLimiter:
+    """
+    Lets at most `per_minute` calls start in any rolling minute. Calls start
+    immediately while the quota allows, then wait for the oldest to age out.
+    Thread-safe.
+    """
 
-@dataclass
+    def __init__(self, per_minute: float):
+        self.capacity = max(1, int(per_minute))
+        self.window = 60.0 * self.capacity / per_minute  # One minute unless per_minute is fractional
+        self._starts = deque()  # Start times within the last window, oldest first
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Blocks until the caller may start its next call."""
+        with self._lock:
+            now = time.monotonic()
+            while self._starts and now - self._starts[0] >= self.window:
+                self._starts.popleft()
+            start = now
+            if len(self._starts) >= self.capacity:
+                # Take the slot freed when this call's predecessor `capacity` places back ages out
+                start = max(now, self._starts[-self.capacity] + self.window)
+            self._starts.append(start)
+        if start > now:
+            time.sleep(start - now)
+
+
+# Slotted dataclasses need Python 3.10+; on 3.9 instances keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CallAnalysis:
     """Structured data from a cold call transcription."""
     transcript: str
@@ -63,9 +158,16 @@ class CallAnalysis:
     phone_number: Optional[str] = None  # Phone number extracted from filename
 
 
-def get_analysis_prompt() -> str:
-    """Returns the prompt for Gemini to analyze cold calls."""
-    return """Analyze this cold call recording carefully. Extract the following information:
+_CALL_ANALYSIS_FIELDS = tuple(f.name for f in fields(CallAnalysis))
+
+
+def call_analysis_to_dict(analysis: CallAnalysis) -> dict:
+    """Shallow dict of a CallAnalysis's fields (unlike asdict, lists are not deep-copied)."""
+    return {name: getattr(analysis, name) for name in _CALL_ANALYSIS_FIELDS}
+
+
+# Prompt for Gemini to analyze cold calls; the same for every recording
+_ANALYSIS_PROMPT = """Analyze this cold call recording carefully. Extract the following information:
 
 IMPORTANT: The cold caller may have side conversations with teammates in Urdu or Hindi. These internal conversations should be COMPLETELY EXCLUDED from the transcript. Only transcribe the actual cold call conversation with the recipient (typically in English).
 
@@ -107,6 +209,11 @@ Respond ONLY with a valid JSON object with these exact keys:
 }"""
 
 
+def get_analysis_prompt() -> str:
+    """Returns the prompt for Gemini to analyze cold calls."""
+    return _ANALYSIS_PROMPT
+
+
 def extract_phone_from_filename(file_path: Path) -> Optional[str]:
     """
     Extracts phone number from filename.
@@ -131,29 +238,175 @@ def sanitize_filename(name: str) -> str:
     """Sanitizes a string for safe use as a filename."""
     if not name:
         return "Unknown"
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', str(name)).strip()
-    sanitized = re.sub(r'_+', '_', sanitized)  # Collapse multiple underscores
+    # str() first, since model output may not be a (hashable) string
+    return _sanitize_filename(str(name))
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_filename(name: str) -> str:
+    """Cached body of sanitize_filename; the same companies and recipients recur across calls."""
+    sanitized = _FILENAME_UNSAFE_RE.sub('_', name).strip()
+    sanitized = _UNDERSCORES_RE.sub('_', sanitized)  # Collapse multiple underscores
     return sanitized[:100]  # Limit length
 
 
 def parse_json_response(text: str) -> dict:
     """Extracts and parses JSON from Gemini's response."""
-    text = text.strip()
+    # We request application/json, so the response is normally the object itself
+    error = None
+    try:
+        result = _json_loads(text)
+    except json.JSONDecodeError as e:
+        error = e
+    else:
+        if isinstance(result, dict):
+            return result
 
-    # Try to find JSON object in the response
-    match = re.search(r'\{.*\}', text, re.DOTALL)
+    # Fallback: find the JSON object within surrounding text
+    match = _JSON_OBJECT_RE.search(text)
     if match:
-        return json.loads(match.group(0))
+        return _json_loads(match.group(0))
+    if error is not None:
+        raise error
+    raise json.JSONDecodeError("Expected a JSON object", text, 0)
+
+
+def _likely_date_format(date_str: str) -> str:
+    """Picks the tag date format (see _TAG_DATE_FORMATS) that matches the string's shape."""
+    if 'T' in date_str:
+        if date_str.endswith('Z'):
+            return "%Y-%m-%dT%H:%M:%SZ"
+        if '+' in date_str[10:] or '-' in date_str[10:]:
+            return "%Y-%m-%dT%H:%M:%S%z"
+        return "%Y-%m-%dT%H:%M:%S"
+    if len(date_str) == 16:
+        return "%Y-%m-%d %H:%M"
+    if len(date_str) == 10:
+        return "%Y-%m-%d"
+    return "%Y"
+
+
+def _read_id3_tdrc(file_path: Path) -> Optional[str]:
+    """Reads the TDRC (recording time) frame straight from an ID3v2.3/2.4 tag, or None."""
+    with open(file_path, 'rb') as f:
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b'ID3' or header[3] not in (3, 4):
+            return None
+        version, flags = header[3], header[5]
+        if flags & 0x80:  # Unsynchronised tags are left to mutagen
+            return None
+        size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        end = 10 + size
+
+        if flags & 0x40:  # Skip the extended header
+            ext = f.read(4)
+            if len(ext) < 4:
+                return None
+            if version == 4:
+                # The v2.4 size includes these 4 bytes
+                ext_size = (ext[0] << 21) | (ext[1] << 14) | (ext[2] << 7) | ext[3]
+                if ext_size < 4:
+                    return None
+                f.seek(ext_size - 4, os.SEEK_CUR)
+            else:
+                f.seek(struct.unpack('>I', ext)[0], os.SEEK_CUR)
 
-    # Fallback: try parsing the whole text
-    return json.loads(text)
+        while f.tell() + 10 <= end:
+            frame = f.read(10)
+            frame_id = frame[:4]
+            if len(frame) < 10 or frame_id == b'\0\0\0\0':  # Padding
+                return None
+            if version == 4:
+                frame_size = (frame[4] << 21) | (frame[5] << 14) | (frame[6] << 7) | frame[7]
+            else:
+                frame_size = struct.unpack('>I', frame[4:8])[0]
+            if frame_id != b'TDRC':
+                f.seek(frame_size, os.SEEK_CUR)
+                continue
+
+            payload = f.read(frame_size)
+            if not payload or len(payload) < frame_size:  # Truncated file
+                return None
+            encoding = ('latin-1', 'utf-16', 'utf-16-be', 'utf-8')[payload[0]] if payload[0] < 4 else None
+            if encoding is None:
+                return None
+            text = payload[1:].decode(encoding, errors='replace').split('\0')[0]
+            return text or None
+    return None
 
 
-def get_file_datetime(file_path: Path) -> str:
-    """Gets the file's modification datetime as a formatted string."""
-    mtime = file_path.stat().st_mtime
-    dt = datetime.fromtimestamp(mtime)
-    return dt.strftime("%Y-%m-%d %H:%M")
+def _read_mp4_day(file_path: Path) -> Optional[str]:
+    """Reads the ©day atom (moov/udta/meta/ilst/©day) straight from an MP4/M4A file, or None."""
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        f.seek(0)
+        # Descend one atom per level; meta is a full box with 4 bytes of version/flags
+        for target in (b'moov', b'udta', b'meta', b'ilst', b'\xa9day', b'data'):
+            while True:
+                start = f.tell()
+                if start + 8 > end:
+                    return None
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                size, kind = struct.unpack('>I4s', header)
+                header_size = 8
+                if size == 1:
+                    large_size = f.read(8)
+                    if len(large_size) < 8:
+                        return None
+                    size = struct.unpack('>Q', large_size)[0]
+                    header_size = 16
+                elif size == 0:
+                    size = end - start
+                if size < header_size:
+                    return None
+                if kind == target:
+                    end = start + size
+                    if kind == b'meta':
+                        f.seek(4, os.SEEK_CUR)
+                    break
+                f.seek(start + size)
+        # data atom: 4 bytes of type, 4 bytes of locale, then the UTF-8 value
+        f.seek(8, os.SEEK_CUR)
+        length = end - f.tell()
+        raw = f.read(length) if length > 0 else b''
+        if len(raw) < length:  # Truncated file
+            return None
+        return raw.decode('utf-8', errors='replace') or None
+
+
+def _read_tag_date(file_path: Path) -> Optional[str]:
+    """Reads the recording date from the tag header directly for MP3 and MP4/M4A files."""
+    suffix = file_path.suffix.lower()
+    if suffix == '.mp3':
+        return _read_id3_tdrc(file_path)
+    if suffix in _MP4_EXTENSIONS:
+        return _read_mp4_day(file_path)
+    return None
+
+
+def _probe_tag_date(file_path: Path) -> Optional[str]:
+    """Reads the creation_time/date tag with ffprobe, or None if unavailable or missing."""
+    if not FFPROBE:
+        return None
+    try:
+        result = subprocess.run(
+            [FFPROBE, "-v", "quiet", "-show_format", "-print_format", "json", str(file_path)],
+            capture_output=True, timeout=FFPROBE_TIMEOUT, check=True,
+        )
+        tags = _json_loads(result.stdout).get("format", {}).get("tags", {})
+    except (OSError, subprocess.SubprocessError, json.JSONDecodeError) as e:
+        logger.debug(f"ffprobe failed for {file_path}: {e}")
+        return None
+
+    # Vorbis comments and some containers use upper-case keys
+    tags = {key.lower(): value for key, value in tags.items()}
+    for key in ("creation_time", "date"):
+        if tags.get(key):
+            return _FRACTIONAL_SECONDS_RE.sub(r'\1', tags[key])
+    return None
 
 
 def extract_recording_timestamp(file_path: Path) -> str:
@@ -165,7 +418,11 @@ def extract_recording_timestamp(file_path: Path) -> str:
     timestamp = None
     
     try:
-        f = mutagen.File(str(file_path))
+        # Fast path: read just the date field from the tag header, then ask
+        # ffprobe, leaving mutagen as the last resort
+        date_str = _read_tag_date(file_path) or _probe_tag_date(file_path)
+
+        f = None if date_str else mutagen.File(str(file_path))
         if f:
             # Strategy 1: Common date/time tags
             # TDRC: Recording time (ID3v2.4)
@@ -174,8 +431,6 @@ def extract_recording_timestamp(file_path: Path) -> str:
             
             tags = f.tags if hasattr(f, 'tags') else {}
             
-            date_str = None
-            
             if tags:
                 # Try common keys
                 keys_to_check = ['TDRC', '©day', 'date', 'creation_time']
@@ -188,48 +443,36 @@ def extract_recording_timestamp(file_path: Path) -> str:
                             date_str = str(val)
                         break
             
-            if date_str:
-                # Attempt to parse common formats
-                # 2023-10-27T14:30:00, 2023-10-27, etc.
-                formats = [
-                    "%Y-%m-%dT%H:%M:%S%z", # ISO with timezone
-                    "%Y-%m-%dT%H:%M:%SZ",  # ISO UTC
-                    "%Y-%m-%dT%H:%M:%S",   # ISO simple
-                    "%Y-%m-%d %H:%M",      # Simple date time
-                    "%Y-%m-%d",            # Date only
-                    "%Y",                  # Year only
-                ]
-                
-                for fmt in formats:
-                    try:
-                        # Simple cleanup before parsing
-                        clean_date = date_str.strip()
-                        dt = datetime.strptime(clean_date, fmt)
-                        # If we only got a date, combine with 00:00:00
-                        timestamp = dt.strftime("%d-%m-%Y_%H-%M-%S")
-                        break
-                    except ValueError:
-                        continue
-                        
+        if date_str:
+            # Parse with the format the string's shape points to, trying
+            # the rest only if that guess fails
+            clean_date = date_str.strip()
+            likely = _likely_date_format(clean_date)
+            for fmt in (likely, *(f for f in _TAG_DATE_FORMATS if f != likely)):
+                try:
+                    dt = datetime.strptime(clean_date, fmt)
+                    # If we only got a date, combine with 00:00:00
+                    timestamp = dt.strftime("%d-%m-%Y_%H-%M-%S")
+                    break
+                except ValueError:
+                    continue
+
     except Exception as e:
         logger.debug(f"Metadata extraction failed for {file_path}: {e}")
 
     # Fallback to file system modification time
     if not timestamp:
-        mtime = file_path.stat().st_mtime
-        dt = datetime.fromtimestamp(mtime)
+        dt = datetime.fromtimestamp(file_path.stat().st_mtime)
         timestamp = dt.strftime("%d-%m-%Y_%H-%M-%S")
         
     return timestamp
 
 
-def transcribe_and_analyze(client: genai.Client, audio_path: Path, model_name: str) -> Optional[CallAnalysis]:
+def transcribe_and_analyze(client: genai.Client, audio_path: Path, model_name: str,
+                           rate_limiter: Optional["RateLimiter"] = None) -> Optional[CallAnalysis]:
     """Uploads audio to Gemini, transcribes and analyzes the cold call."""
     logger.info(f"Uploading: {audio_path.name}")
 
-    # Get file date as fallback
-    file_datetime = get_file_datetime(audio_path)
-    
     # Generate detailed timestamp for filename from metadata
     timestamp_prefix = extract_recording_timestamp(audio_path)
     
@@ -248,6 +491,8 @@ def transcribe_and_analyze(client: genai.Client, audio_path: Path, model_name: s
     max_retries = 3
     for attempt in range(max_retries):
         try:
+            if rate_limiter:
+                rate_limiter.wait()
             logger.info(f"Analyzing with {model_name}...")
             response = client.models.generate_content(
                 model=model_name,
@@ -276,6 +521,12 @@ def transcribe_and_analyze(client: genai.Client, audio_path: Path, model_name: s
         logger.debug(f"Raw response: {response.text[:500]}")
         return None
 
+    return build_call_analysis(result, model_name, timestamp_prefix, phone_number)
+
+
+def build_call_analysis(result: dict, model_name: str, timestamp_prefix: str,
+                        phone_number: Optional[str]) -> CallAnalysis:
+    """Builds a CallAnalysis from Gemini's parsed JSON and the recording's metadata."""
     # Use file datetime as fallback if call_date not mentioned
     call_date_pkt = result.get('call_date_pkt')
     if not call_date_pkt:
@@ -303,8 +554,108 @@ def transcribe_and_analyze(client: genai.Client, audio_path: Path, model_name: s
     )
 
 
-def save_analysis(analysis: CallAnalysis, output_dir: Path, base_name: str, formats: list[str]) -> list[Path]:
-    """Saves the analysis in specified formats. Returns list of saved file paths."""
+def transcribe_and_analyze_batch(client: genai.Client, audio_paths: list[Path],
+                                 model_name: str) -> dict[str, Optional[CallAnalysis]]:
+    """
+    Transcribes and analyzes many recordings as one Gemini Batch Mode job.
+    Returns the analysis (None on failure) for each file name.
+    """
+    analyses = {audio_path.name: None for audio_path in audio_paths}
+    metadata = {}
+    prompt = get_analysis_prompt()
+
+    # Upload the recordings and describe one request per file
+    lines = []
+    for audio_path in audio_paths:
+        logger.info(f"Uploading: {audio_path.name}")
+        try:
+            uploaded_file = client.files.upload(file=str(audio_path))
+        except Exception as e:
+            logger.error(f"Upload failed for {audio_path.name}: {e}")
+            continue
+        metadata[audio_path.name] = (extract_recording_timestamp(audio_path), extract_phone_from_filename(audio_path))
+        lines.append(json.dumps({
+            "key": audio_path.name,
+            "request": {
+                "contents": [{
+                    "role": "user",
+                    "parts": [
+                        {"text": prompt},
+                        {"file_data": {"file_uri": uploaded_file.uri, "mime_type": uploaded_file.mime_type}},
+                    ],
+                }],
+                "generation_config": {"response_mime_type": "application/json"},
+            },
+        }))
+
+    if not lines:
+        return analyses
+
+    try:
+        requests_file = client.files.upload(
+            file=io.BytesIO("\n".join(lines).encode("utf-8")),
+            config={"mime_type": "jsonl", "display_name": "cold-call-batch"}
+        )
+        job = client.batches.create(model=model_name, src=requests_file.name)
+    except Exception as e:
+        logger.error(f"Failed to submit batch job: {e}")
+        return analyses
+    logger.info(f"Submitted batch job {job.name} with {len(lines)} recording(s)")
+
+    # Batch jobs can take a while, so back off between status checks
+    delay = BATCH_POLL_INITIAL
+    while True:
+        try:
+            job = client.batches.get(name=job.name)
+        except Exception as e:
+            logger.warning(f"Failed to check batch job status: {e}")
+        else:
+            state = job.state.name if job.state else None
+            if state in BATCH_DONE_STATES:
+                break
+            logger.info(f"Batch job {state}, checking again in {delay}s...")
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+
+    if state not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"):
+        logger.error(f"Batch job ended in {state}: {job.error}")
+        return analyses
+
+    try:
+        output = client.files.download(file=job.dest.file_name)
+    except Exception as e:
+        logger.error(f"Failed to download batch results: {e}")
+        return analyses
+
+    for line in output.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        entry = _json_loads(line)
+        name = entry.get("key")
+        if name not in metadata:
+            continue
+        if "response" not in entry:
+            logger.error(f"API error for {name}: {entry.get('error')}")
+            continue
+        try:
+            parts = entry["response"]["candidates"][0]["content"]["parts"]
+            text = "".join(part.get("text", "") for part in parts if not part.get("thought"))
+            result = parse_json_response(text)
+        except (KeyError, IndexError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to parse response for {name}: {e}")
+            continue
+        timestamp_prefix, phone_number = metadata[name]
+        analyses[name] = build_call_analysis(result, model_name, timestamp_prefix, phone_number)
+
+    return analyses
+
+
+def save_analysis(analysis: CallAnalysis, output_dir: Path, base_name: str, formats: list[str],
+                  source_file: Optional[str] = None) -> list[Path]:
+    """
+    Saves the analysis in specified formats. Returns list of saved file paths.
+    `source_file` is recorded in the JSON output for resume tracking.
+    """
     saved_files = []
 
     # Build filename from metadata
@@ -334,8 +685,11 @@ def save_analysis(analysis: CallAnalysis, output_dir: Path, base_name: str, form
     # Save in each format
     if "json" in formats:
         json_path = output_dir / f"{file_stem}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(analysis), f, indent=2, ensure_ascii=False)
+        data = call_analysis_to_dict(analysis)
+        if source_file:
+            data['source_file'] = source_file
+        with open(json_path, 'wb') as f:
+            f.write(_json_dumps_pretty(data))
         saved_files.append(json_path)
 
     if "txt" in formats:
@@ -347,154 +701,138 @@ def save_analysis(analysis: CallAnalysis, output_dir: Path, base_name: str, form
     if "md" in formats:
         md_path = output_dir / f"{file_stem}.md"
         with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(format_markdown(analysis))
+            f.writelines(f"{line}\n" for line in format_markdown(analysis))
         saved_files.append(md_path)
 
     return saved_files
 
 
-def format_markdown(analysis: CallAnalysis) -> str:
-    """Formats the analysis as a readable Markdown document."""
-    lines = ["# Cold Call Analysis\n"]
+def format_markdown(analysis: CallAnalysis) -> Iterator[str]:
+    """Formats the analysis as a readable Markdown document, one line at a time."""
+    yield "# Cold Call Analysis\n"
 
     # Metadata section
-    lines.append("## Call Information\n")
+    yield "## Call Information\n"
     if analysis.caller_name:
-        lines.append(f"- **Caller**: {analysis.caller_name}")
+        yield f"- **Caller**: {analysis.caller_name}"
     if analysis.recipients:
-        lines.append(f"- **Recipients**: {analysis.recipients}")
+        yield f"- **Recipients**: {analysis.recipients}"
     if analysis.owner_name:
-        lines.append(f"- **Owner/Target**: {analysis.owner_name}")
+        yield f"- **Owner/Target**: {analysis.owner_name}"
     if analysis.company_name:
-        lines.append(f"- **Company**: {analysis.company_name}")
+        yield f"- **Company**: {analysis.company_name}"
     if analysis.company_location:
-        lines.append(f"- **Location**: {analysis.company_location}")
+        yield f"- **Location**: {analysis.company_location}"
     if analysis.phone_number:
-        lines.append(f"- **Phone Number**: {analysis.phone_number}")
+        yield f"- **Phone Number**: {analysis.phone_number}"
     if analysis.call_date_pkt:
-        lines.append(f"- **Date (PKT)**: {analysis.call_date_pkt}")
+        yield f"- **Date (PKT)**: {analysis.call_date_pkt}"
     if analysis.call_duration_estimate:
-        lines.append(f"- **Duration**: {analysis.call_duration_estimate}")
+        yield f"- **Duration**: {analysis.call_duration_estimate}"
     if analysis.call_outcome:
-        lines.append(f"- **Outcome**: {analysis.call_outcome.replace('_', ' ').title()}")
+        yield f"- **Outcome**: {analysis.call_outcome.replace('_', ' ').title()}"
     if analysis.interest_level is not None:
-        lines.append(f"- **Interest Level**: {analysis.interest_level}/10")
-    lines.append("")
+        yield f"- **Interest Level**: {analysis.interest_level}/10"
+    yield ""
 
     # Processing info section
     if analysis.model_used:
-        lines.append("## Processing Info\n")
-        lines.append(f"- **Model**: {analysis.model_used}")
-        lines.append("")
+        yield "## Processing Info\n"
+        yield f"- **Model**: {analysis.model_used}"
+        yield ""
 
     # Summary
     if analysis.call_summary:
-        lines.append("## Summary\n")
-        lines.append(analysis.call_summary)
-        lines.append("")
+        yield "## Summary\n"
+        yield analysis.call_summary
+        yield ""
 
     # Objections
     if analysis.objections:
-        lines.append("## Objections Raised\n")
+        yield "## Objections Raised\n"
         for obj in analysis.objections:
-            lines.append(f"- {obj}")
-        lines.append("")
+            yield f"- {obj}"
+        yield ""
 
     # Pain points
     if analysis.pain_points:
-        lines.append("## Pain Points Identified\n")
+        yield "## Pain Points Identified\n"
         for pain in analysis.pain_points:
-            lines.append(f"- {pain}")
-        lines.append("")
+            yield f"- {pain}"
+        yield ""
 
     # Follow-ups
     if analysis.follow_up_actions:
-        lines.append("## Follow-Up Actions\n")
+        yield "## Follow-Up Actions\n"
         for action in analysis.follow_up_actions:
-            lines.append(f"- [ ] {action}")
-        lines.append("")
+            yield f"- [ ] {action}"
+        yield ""
 
     # Transcript
-    lines.append("## Full Transcript\n")
-    lines.append("```")
-    lines.append(analysis.transcript)
-    lines.append("```")
-
-    return "\n".join(lines)
+    yield "## Full Transcript\n"
+    yield "```"
+    yield analysis.transcript
+    yield "```"
 
 
 def generate_summary_report(results: list[tuple[str, CallAnalysis]], output_dir: Path) -> Path:
     """Generates a summary report of all processed calls."""
     report_path = output_dir / "SUMMARY_REPORT.md"
 
-    lines = [
-        f"# Cold Call Summary Report",
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n",
-        f"Total Calls Processed: {len(results)}\n",
-    ]
-
-    # Statistics
-    outcomes = {}
-    total_interest = 0
-    interest_count = 0
-    all_objections = {}
-    models_used = set()
+    # Written line by line so the whole report is never held in memory
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.writelines(f"{line}\n" for line in format_summary_report(results))
 
-    for _, analysis in results:
-        outcome = analysis.call_outcome or "unknown"
-        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return report_path
 
-        if analysis.interest_level is not None:
-            total_interest += analysis.interest_level
-            interest_count += 1
 
-        for obj in (analysis.objections or []):
-            obj_lower = obj.lower()
-            all_objections[obj_lower] = all_objections.get(obj_lower, 0) + 1
+def format_summary_report(results: list[tuple[str, CallAnalysis]]) -> Iterator[str]:
+    """Formats the summary report as Markdown, one line at a time."""
+    yield f"# Cold Call Summary Report"
+    yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+    yield f"Total Calls Processed: {len(results)}\n"
 
-        if analysis.model_used:
-            models_used.add(analysis.model_used)
+    # Statistics
+    outcomes = Counter(analysis.call_outcome or "unknown" for _, analysis in results)
+    interests = [analysis.interest_level for _, analysis in results if analysis.interest_level is not None]
+    all_objections = Counter(obj.lower() for _, analysis in results for obj in (analysis.objections or []))
+    models_used = {analysis.model_used for _, analysis in results if analysis.model_used}
 
-    lines.append("## Outcome Breakdown\n")
-    for outcome, count in sorted(outcomes.items(), key=lambda x: -x[1]):
-        lines.append(f"- {outcome.replace('_', ' ').title()}: {count}")
-    lines.append("")
+    yield "## Outcome Breakdown\n"
+    for outcome, count in outcomes.most_common():
+        yield f"- {outcome.replace('_', ' ').title()}: {count}"
+    yield ""
 
-    if interest_count > 0:
-        avg_interest = total_interest / interest_count
-        lines.append(f"## Average Interest Level: {avg_interest:.1f}/10\n")
+    if interests:
+        avg_interest = sum(interests) / len(interests)
+        yield f"## Average Interest Level: {avg_interest:.1f}/10\n"
 
     if models_used:
-        lines.append("## Model(s) Used\n")
-        lines.append(f"- {', '.join(sorted(models_used))}")
-        lines.append("")
+        yield "## Model(s) Used\n"
+        yield f"- {', '.join(sorted(models_used))}"
+        yield ""
 
     if all_objections:
-        lines.append("## Common Objections\n")
-        for obj, count in sorted(all_objections.items(), key=lambda x: -x[1])[:10]:
-            lines.append(f"- {obj}: {count}x")
-        lines.append("")
+        yield "## Common Objections\n"
+        for obj, count in all_objections.most_common(10):
+            yield f"- {obj}: {count}x"
+        yield ""
 
     # Individual call summaries
-    lines.append("## Call Details\n")
+    yield "## Call Details\n"
     for filename, analysis in results:
         company = analysis.company_name or "Unknown Company"
         outcome = (analysis.call_outcome or "unknown").replace('_', ' ').title()
         interest = f"{analysis.interest_level}/10" if analysis.interest_level else "N/A"
 
-        lines.append(f"### {company}")
-        lines.append(f"- **File**: {filename}")
-        lines.append(f"- **Outcome**: {outcome} | **Interest**: {interest}")
+        yield f"### {company}"
+        yield f"- **File**: {filename}"
+        yield f"- **Outcome**: {outcome} | **Interest**: {interest}"
         if analysis.call_summary:
-            lines.append(f"- **Summary**: {analysis.call_summary}")
+            yield f"- **Summary**: {analysis.call_summary}"
         if analysis.follow_up_actions:
-            lines.append(f"- **Follow-up**: {', '.join(analysis.follow_up_actions[:2])}")
-        lines.append("")
-
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
-
-    return report_path
+            yield f"- **Follow-up**: {', '.join(analysis.follow_up_actions[:2])}"
+        yield ""
 
 
 def find_audio_files(path: Path) -> list[Path]:
@@ -507,40 +845,54 @@ def find_audio_files(path: Path) -> list[Path]:
             return []
 
     if path.is_dir():
-        files = set()  # Use set to avoid duplicates on case-insensitive file systems (Windows)
-        for ext in AUDIO_EXTENSIONS:
-            files.update(path.glob(f"*{ext}"))
-            files.update(path.glob(f"*{ext.upper()}"))
-        return sorted(files)
+        # One directory listing, matching extensions case-insensitively
+        return sorted(p for p in path.iterdir() if p.suffix.lower() in AUDIO_EXTENSIONS and p.is_file())
 
     return []
 
 
-def load_processed_recordings(base_dir: Path) -> set[str]:
-    """Loads the set of already processed recording filenames from the tracking file."""
+def audio_digest(file_path: Path) -> str:
+    """Content hash of a recording, so renamed copies are recognised as already processed."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        # Hash through a read-only mapping so the audio isn't copied onto the heap
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+def load_processed_recordings(base_dir: Path) -> tuple[set[str], set[str]]:
+    """
+    Loads already processed recordings from the tracking file.
+    Returns (filenames, audio digests); older entries have no digest.
+    """
     processed_file = base_dir / PROCESSED_RECORDINGS_FILE
     processed = set()
+    digests = set()
     
     if processed_file.exists():
         try:
             with open(processed_file, 'r', encoding='utf-8') as f:
                 for line in f:
-                    filename = line.strip()
+                    filename, _, digest = line.strip().partition('\t')
                     if filename:
                         processed.add(filename)
+                    if digest:
+                        digests.add(digest)
             logger.info(f"Loaded {len(processed)} previously processed recordings from {PROCESSED_RECORDINGS_FILE}")
         except Exception as e:
             logger.warning(f"Failed to load processed recordings file: {e}")
     
-    return processed
+    return processed, digests
 
 
-def add_processed_recording(base_dir: Path, filename: str) -> None:
-    """Adds a recording filename to the processed recordings tracking file."""
+def add_processed_recording(base_dir: Path, filename: str, digest: Optional[str] = None) -> None:
+    """Adds a recording filename (and its audio digest) to the processed recordings tracking file."""
     processed_file = base_dir / PROCESSED_RECORDINGS_FILE
     try:
         with open(processed_file, 'a', encoding='utf-8') as f:
-            f.write(f"{filename}\n")
+            f.write(f"{filename}\t{digest}\n" if digest else f"{filename}\n")
     except Exception as e:
         logger.warning(f"Failed to update processed recordings file: {e}")
 
@@ -555,9 +907,10 @@ Examples:
   %(prog)s recordings/                 # Process all audio in folder
   %(prog)s recordings/ -f json md      # Output as JSON and Markdown
   %(prog)s recordings/ -o transcripts/ # Custom output directory
+  %(prog)s recordings/ --batch         # Submit all files as one Batch Mode job
 
 Note: Processed recordings are automatically tracked in processed_recordings.txt
-      to prevent duplicate transcriptions.
+      (by file name and audio content) to prevent duplicate transcriptions.
         """
     )
 
@@ -592,6 +945,23 @@ Note: Processed recordings are automatically tracked in processed_recordings.txt
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        default=4,
+        help="Number of files to analyze at once (default: 4)"
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=float(os.getenv("GEMINI_RPM", "10")),
+        help="Max Gemini requests started per minute (default: 10)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Analyze all files in one Gemini Batch Mode job (cheaper, but results take longer)"
+    )
     parser.add_argument(
         "--appwrite",
         action="store_true",
@@ -599,6 +969,10 @@ Note: Processed recordings are automatically tracked in processed_recordings.txt
     )
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.rpm <= 0:
+        parser.error("--rpm must be positive")
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -624,7 +998,7 @@ Note: Processed recordings are automatically tracked in processed_recordings.txt
     # Load already processed recordings from tracking file
     # This is always loaded (not just with --resume) to prevent duplicate transcriptions
     input_dir = input_path if input_path.is_dir() else input_path.parent
-    processed_files = load_processed_recordings(input_dir)
+    processed_files, processed_digests = load_processed_recordings(input_dir)
 
     # Initialize Gemini client
     try:
@@ -646,31 +1020,39 @@ Note: Processed recordings are automatically tracked in processed_recordings.txt
         else:
             logger.warning("Appwrite credentials not configured, skipping database")
 
-    # Process files
-    results = []
+    # Skip files that were already processed
+    pending = []
+    digests = {}  # file name -> audio digest, for files still to process
     for i, audio_file in enumerate(audio_files, 1):
-        # Skip if already processed
         if audio_file.name in processed_files:
             logger.info(f"[{i}/{len(audio_files)}] Skipping (already processed): {audio_file.name}")
             continue
+        try:
+            digest = audio_digest(audio_file)
+        except OSError as e:
+            logger.warning(f"Could not hash {audio_file.name}: {e}")
+            digest = None
+        if digest and digest in processed_digests:
+            logger.info(f"[{i}/{len(audio_files)}] Skipping (same audio already processed): {audio_file.name}")
+            continue
+        digests[audio_file.name] = digest
+        pending.append((i, audio_file))
 
-        logger.info(f"[{i}/{len(audio_files)}] Processing: {audio_file.name}")
+    # In batch mode every file is analyzed up front by a single job
+    batch_analyses = None
+    if args.batch and pending:
+        batch_analyses = transcribe_and_analyze_batch(client, [f for _, f in pending], args.model)
 
-        analysis = transcribe_and_analyze(client, audio_file, args.model)
+    # Handle one finished file; runs on the main thread as results arrive
+    completed = []  # (position, file name, analysis)
 
+    def record_analysis(i: int, audio_file: Path, analysis: Optional[CallAnalysis]):
         if analysis:
-            # Add source file to analysis for resume tracking
-            analysis_dict = asdict(analysis)
-            analysis_dict['source_file'] = audio_file.name
-
-            saved = save_analysis(analysis, output_dir, audio_file.stem, args.formats)
-
-            # Update JSON with source file info
-            for f in saved:
-                if f.suffix == '.json':
-                    with open(f, 'w', encoding='utf-8') as fp:
-                        json.dump(analysis_dict, fp, indent=2, ensure_ascii=False)
+            # Source file goes into the JSON for resume tracking
+            saved = save_analysis(analysis, output_dir, audio_file.stem, args.formats,
+                                  source_file=audio_file.name)
 
+            logger.info(f"[{i}/{len(audio_files)}] Done: {audio_file.name}")
             logger.info(f"  Saved: {', '.join(f.name for f in saved)}")
             logger.info(f"  Outcome: {analysis.call_outcome} | Interest: {analysis.interest_level}/10")
 
@@ -681,15 +1063,34 @@ Note: Processed recordings are automatically tracked in processed_recordings.txt
                     logger.info(f"  Appwrite ID: {doc_id}")
 
             # Mark as processed in the tracking file
-            add_processed_recording(input_dir, audio_file.name)
+            add_processed_recording(input_dir, audio_file.name, digests.get(audio_file.name))
             
-            results.append((audio_file.name, analysis))
+            completed.append((i, audio_file.name, analysis))
         else:
             logger.error(f"  Failed to process {audio_file.name}")
 
-        # Small delay between files to avoid rate limiting
-        if i < len(audio_files):
-            time.sleep(2)
+    # Process files
+    if batch_analyses is not None:
+        for i, audio_file in pending:
+            logger.info(f"[{i}/{len(audio_files)}] Processing: {audio_file.name}")
+            record_analysis(i, audio_file, batch_analyses.get(audio_file.name))
+    else:
+        # Gemini calls are network-bound, so several run at once; the rate
+        # limiter keeps their starts within the per-minute quota
+        rate_limiter = RateLimiter(args.rpm)
+
+        def analyze(i: int, audio_file: Path) -> Optional[CallAnalysis]:
+            logger.info(f"[{i}/{len(audio_files)}] Processing: {audio_file.name}")
+            return transcribe_and_analyze(client, audio_file, args.model, rate_limiter)
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = {executor.submit(analyze, i, audio_file): (i, audio_file) for i, audio_file in pending}
+            for future in as_completed(futures):
+                i, audio_file = futures[future]
+                record_analysis(i, audio_file, future.result())
+
+    # Keep the report in file order regardless of completion order
+    results = [(name, analysis) for _, name, analysis in sorted(completed, key=lambda c: c[0])]
 
     # Generate summary report
     if results and not args.no_summary: